@@ -13,7 +13,7 @@ from collections import defaultdict
 from tuple import UddlTuple
 from parse_tuple import parse_tuple
 from query_parser import QueryStatement, get_ast
-from query_path_conversion import query2path, load_model, ProjectedPath, PathUnion, _get_alias_type
+from query_path_conversion import query2path, load_model, ProjectedPath, PathUnion, _get_alias_type, index_model
 from participant_path_parser import ParticipantPath, EntityResolution, AssociationResolution
 
 
@@ -26,11 +26,10 @@ def get_observable_type_from_characteristic(
     Look up the observable type for a characteristic (rolename) on a given entity type.
     Returns the observable type name, or the characteristic_name if not found.
     """
-    for t in model:
-        if t.subject == source_type and t.predicate == 'composes' and t.rolename == characteristic_name:
-            if isinstance(t.object, str):
-                # Return the observable type (strip namespace if present)
-                return t.object.split('.')[-1] if '.' in t.object else t.object
+    observable = index_model(model).compositions.get((source_type, characteristic_name))
+    if observable is not None:
+        # Return the observable type (strip namespace if present)
+        return observable.split('.')[-1] if '.' in observable else observable
     # Fallback: assume the characteristic name is the observable type
     return characteristic_name
 
@@ -170,6 +169,8 @@ def add_individuals(
     # Use provided model or extract from data tuples
     if model is None:
         model = data_tuples
+    # Index once; every query's path resolution reuses it
+    model = index_model(model)
     
     # Counter for generating unique individual names
     individual_counter = defaultdict(int)
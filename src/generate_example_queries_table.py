@@ -7,14 +7,12 @@ a simple SELECT on an entity, then progressively adding JOINs through associatio
 and compositions to demonstrate increasing complexity.
 """
 
-import xml.etree.ElementTree as ET
 import sys
 import pathlib
 import argparse
 from typing import List, Dict, Set, Tuple, Optional
 from collections import defaultdict
 
-from uddl2tuple import uddl2tuple
 from tuple import UddlTuple
 from query_parser import QueryStatement, Entity, Join, Equivalence, Reference, ProjectedCharacteristic, FromClause, get_ast
 from query_path_conversion import query2path, load_model
@@ -135,8 +133,8 @@ def generate_simple_query(entity_name: str, num_attributes: int = 3) -> QuerySta
     for i in range(min(num_attributes, 3)):
         projections.append(ProjectedCharacteristic(Reference(entity=None, characteristic=f"attr_{i}")))
     
-    from_clause = FromClause(entities=[Entity(name=entity_name, alias=f"{entity_name.lower()}_from")], joins=[])
-    return QueryStatement(projections=projections, from_clause=from_clause)
+    from_clause = FromClause(entities=(Entity(name=entity_name, alias=f"{entity_name.lower()}_from"),), joins=())
+    return QueryStatement(projections=tuple(projections), from_clause=from_clause)
 
 
 def generate_join_query(base_entity: str, join_target: str, join_rolename: str, 
@@ -158,7 +156,7 @@ def generate_join_query(base_entity: str, join_target: str, join_rolename: str,
             right=Reference(entity=target_alias, characteristic=None)
         )]
     
-    return Join(target=Entity(name=join_target, alias=target_alias), on=equivalences)
+    return Join(target=Entity(name=join_target, alias=target_alias), on=tuple(equivalences))
 
 
 def escape_latex(text: str) -> str:
@@ -239,8 +237,8 @@ def generate_progressive_queries(model: List[UddlTuple], entity_name: str, max_d
     # Query 1: Simple SELECT from entity (no aliases)
     projections = [ProjectedCharacteristic(Reference(entity=None, characteristic=attr)) 
                    for attr in attributes[:2]]  # Limit to 2 attributes
-    from_clause = FromClause(entities=[Entity(name=entity_name, alias=None)], joins=[])
-    query1 = QueryStatement(projections=projections, from_clause=from_clause)
+    from_clause = FromClause(entities=(Entity(name=entity_name, alias=None),), joins=())
+    query1 = QueryStatement(projections=tuple(projections), from_clause=from_clause)
     queries.append((query1, f"Simple selection of {entity_name} attributes"))
     
     # Query 2: JOIN through a PartOf association (most common pattern)
@@ -282,22 +280,22 @@ def generate_progressive_queries(model: List[UddlTuple], entity_name: str, max_d
         # No aliases - use entity names directly
         join1 = Join(
             target=Entity(name=assoc_name, alias=None),
-            on=[Equivalence(
+            on=(Equivalence(
                 left=Reference(entity=assoc_name, characteristic='assembly'),
                 right=Reference(entity=entity_name, characteristic=None)
-            )]
+            ),)
         )
         join2 = Join(
             target=Entity(name=part_entity, alias=None),
-            on=[Equivalence(
+            on=(Equivalence(
                 left=Reference(entity=assoc_name, characteristic='part'),
                 right=Reference(entity=part_entity, characteristic=None)
-            )]
+            ),)
         )
         
-        from_clause2 = FromClause(entities=[Entity(name=entity_name, alias=None)], 
-                                 joins=[join1, join2])
-        query2 = QueryStatement(projections=projections2, from_clause=from_clause2)
+        from_clause2 = FromClause(entities=(Entity(name=entity_name, alias=None),), 
+                                 joins=(join1, join2))
+        query2 = QueryStatement(projections=tuple(projections2), from_clause=from_clause2)
         queries.append((query2, f"Join through PartOf association to {part_entity}"))
         
         # Query 3: Add another PartOf join (nested composition)
@@ -332,22 +330,22 @@ def generate_progressive_queries(model: List[UddlTuple], entity_name: str, max_d
                                         # No aliases - use entity names directly
                                         join3 = Join(
                                             target=Entity(name=assoc_name2, alias=None),
-                                            on=[Equivalence(
+                                            on=(Equivalence(
                                                 left=Reference(entity=assoc_name2, characteristic='assembly'),
                                                 right=Reference(entity=part_entity, characteristic=None)
-                                            )]
+                                            ),)
                                         )
                                         join4 = Join(
                                             target=Entity(name=part_entity2, alias=None),
-                                            on=[Equivalence(
+                                            on=(Equivalence(
                                                 left=Reference(entity=assoc_name2, characteristic='part'),
                                                 right=Reference(entity=part_entity2, characteristic=None)
-                                            )]
+                                            ),)
                                         )
                                         
-                                        from_clause3 = FromClause(entities=[Entity(name=entity_name, alias=None)],
-                                                                 joins=[join1, join2, join3, join4])
-                                        query3 = QueryStatement(projections=projections3, from_clause=from_clause3)
+                                        from_clause3 = FromClause(entities=(Entity(name=entity_name, alias=None),),
+                                                                 joins=(join1, join2, join3, join4))
+                                        query3 = QueryStatement(projections=tuple(projections3), from_clause=from_clause3)
                                         queries.append((query3, f"Nested PartOf join to {part_entity2}"))
                                         query3_generated = True
                                         break
@@ -411,29 +409,29 @@ def generate_progressive_queries(model: List[UddlTuple], entity_name: str, max_d
                                             # Join sensor PartOf (no aliases)
                                             join_sensor_assoc = Join(
                                                 target=Entity(name=sensor_partof_assoc, alias=None),
-                                                on=[Equivalence(
+                                                on=(Equivalence(
                                                     left=Reference(entity=sensor_partof_assoc, characteristic='assembly'),
                                                     right=Reference(entity=entity_name, characteristic=None)
-                                                )]
+                                                ),)
                                             )
                                             join_sensor = Join(
                                                 target=Entity(name=sensor_entity, alias=None),
-                                                on=[Equivalence(
+                                                on=(Equivalence(
                                                     left=Reference(entity=sensor_partof_assoc, characteristic='part'),
                                                     right=Reference(entity=sensor_entity, characteristic=None)
-                                                )]
+                                                ),)
                                             )
                                             join_obs = Join(
                                                 target=Entity(name=obs_assoc_name, alias=None),
-                                                on=[Equivalence(
+                                                on=(Equivalence(
                                                     left=Reference(entity=obs_assoc_name, characteristic='observer'),
                                                     right=Reference(entity=sensor_entity, characteristic=None)
-                                                )]
+                                                ),)
                                             )
                                             
-                                            from_clause4 = FromClause(entities=[Entity(name=entity_name, alias=None)],
-                                                                     joins=[join1, join2, join_sensor_assoc, join_sensor, join_obs])
-                                            query4 = QueryStatement(projections=projections4, from_clause=from_clause4)
+                                            from_clause4 = FromClause(entities=(Entity(name=entity_name, alias=None),),
+                                                                     joins=(join1, join2, join_sensor_assoc, join_sensor, join_obs))
+                                            query4 = QueryStatement(projections=tuple(projections4), from_clause=from_clause4)
                                             queries.append((query4, f"Join through sensor and Observe association {obs_assoc_name}"))
                                             break
                                 if len(queries) >= 4:
@@ -484,9 +482,7 @@ def main():
     
     # Load model
     try:
-        tree = ET.parse(args.face_file)
-        tuples = uddl2tuple(tree)
-        model = [t for t in tuples if isinstance(t, UddlTuple)]
+        model = load_model(args.face_file)
     except Exception as e:
         print(f"Error loading model: {e}", file=sys.stderr)
         sys.exit(1)
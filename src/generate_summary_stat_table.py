@@ -2,7 +2,113 @@ import xml.etree.ElementTree as ET
 import sys
 import pathlib
 import argparse
+import functools
+import itertools
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from query_parser import UDDLQueryParser
+
+
+# Exact xmi:type values of the elements counted in the summary
+_ENTITY_TYPES = frozenset(("conceptual:Entity",))
+_ASSOCIATION_TYPES = frozenset(("conceptual:Association",))
+_COMPOSITION_TYPES = frozenset(("conceptual:Composition",))
+_PARTICIPANT_TYPES = frozenset(("conceptual:Participant",))
+_QUERY_TYPES = frozenset(("platform:Query",))
+
+# Below this many queries, they are parsed in this process instead of a worker pool.
+# Starting the pool takes a few milliseconds, about as long as parsing 128 queries
+_MIN_QUERIES_FOR_POOL = 128
+
+# LaTeX summary table, filled in with str.format_map
+_TEMPLATE = """
+% Generated by {script_name}
+% Arguments: face_file={face_file_path}
+\\begingroup
+    \\centering
+    \\begin{{table*}}[t]
+    \\renewcommand{{\\arraystretch}}{{1.5}}
+    \\begin{{tabularx}}{{\\textwidth}}{{@{{}} >{{\\sffamily\\raggedright\\arraybackslash}}p{{0.35\\textwidth}} >{{\\sffamily\\raggedright\\arraybackslash}}X @{{}}}}
+        \\rowcolor{{tableheader}}
+        \\headingfont\\bfseries UDDL Data Model Statistics & \\headingfont\\bfseries Model Examples \\\\
+        \\addlinespace[4pt]
+        % Left Column: Statistics
+        \\begin{{tabular}}[t]{{@{{}}l r@{{}}}}
+            Number of Entities: & {num_entities} \\\\
+            Number of Associations: & {num_associations} \\\\
+            Total Compositions: & {total_compositions} \\\\
+            Total Participants: & {total_participants} \\\\
+            Total Queries: & {total_queries} \\\\
+            Total Projected Characteristics: & {total_projected_characteristics} \\\\
+            Avg Projections/Query: & {avg_projections_per_query:.1f} \\\\
+            Avg Entities/Query: & {avg_entities_per_query:.1f} \\\\
+            Avg Join Conditions/Query: & {avg_join_conditions_per_query:.1f} \\\\
+            Max Projections: & {max_projections_in_query} \\\\
+            Max Join Conditions: & {max_join_conditions_in_query}
+        \\end{{tabular}}
+        &
+        % Right Column: Examples
+        \\textbf{{Most Central Entity}}: {best_entity_display} (Score: {max_entity_score}) \\newline
+        \\textit{{Compositions}}: {entity_compositions_str} \\par\\vspace{{6pt}}
+        
+        \\textbf{{Most Central Association}}: {best_assoc_display} (Score: {max_assoc_score}) \\newline
+        \\textit{{Compositions}}: {assoc_compositions_str} \\newline
+        \\textit{{Participants}}: {assoc_participants_str} \\par\\vspace{{6pt}}
+        
+        \\textbf{{Observation Pattern}}: {observe_display} \\newline
+        \\textit{{Compositions}}: {observe_compositions_str} \\newline
+        \\textit{{Participants}}: {observe_participants_str} \\par\\vspace{{6pt}}
+        
+        \\textbf{{Assembly Pattern}}: {assembly_display} \\newline
+        \\textit{{Compositions}}: {assembly_compositions_str} \\newline
+        \\textit{{Participants}}: {assembly_participants_str}
+    \\end{{tabularx}}
+    \\caption{{Summary statistics of the UDDL Conceptual Data Model (CDM). The table presents the total counts of core modeling elements: Entities, Associations, Compositions, and Participants, as well as Query statistics including complexity metrics (averages and maximums for projections, entities, JOINs, and join conditions per query). It identifies the most central elements based on their structural connectivity and property density. Additionally, it highlights representative associations for the Observation pattern (\\textit{{Observe}}) and the Assembly pattern (\\textit{{PartOf}}) with their respective compositions and participants.}}
+    \\label{{tab:uddl_summary}}
+    \\end{{table*}}
+\\endgroup
+"""
+
+
+# Translation table escaping underscores for LaTeX
+_ESC = str.maketrans({'_': '\\_'})
+
+
+def esc(s):
+    """Escapes underscores for LaTeX, or returns N/A for a missing name."""
+    return s.translate(_ESC) if s else 'N/A'
+
+
+@functools.lru_cache(maxsize=None)
+def format_composition(rolename, type_name):
+    """Formats a composition for display; (rolename, type_name) pairs repeat across elements."""
+    # If rolename is same as type_name (except for first letter case)
+    # e.g. identifier (Identifier) -> Identifier
+    if rolename and type_name:
+        if rolename == type_name or (len(rolename) > 0 and len(type_name) > 0 and rolename[0].lower() + rolename[1:] == type_name[0].lower() + type_name[1:]):
+            return type_name
+    return f"{rolename} ({type_name})"
+
+
+def _parse_one(specification):
+    """
+    Parses a single query specification and returns its complexity counts.
+    May run in a worker process, so only a small dict of counts is returned.
+    Returns None if the query cannot be parsed.
+    """
+    try:
+        # Clean up query string if needed (e.g. remove XML entities if any, though ElementTree handles basics)
+        ast = UDDLQueryParser(specification).parse()
+    except Exception:
+        return None
+    return {
+        'projections': len(ast.projections),
+        'entities': len(ast.from_clause.entities),
+        'joins': len(ast.from_clause.joins),
+        'join_conditions': sum(len(join.on) for join in ast.from_clause.joins),
+    }
+
 
 def generate_summary_stats(face_file_path):
     try:
@@ -20,21 +126,21 @@ def generate_summary_stats(face_file_path):
     }
     
     # ID maps
-    # We need a map of ID -> Element to traverse paths and resolve types
+    # We need a map of ID -> display name to resolve types and path steps.
+    # The [@xmi:id] predicate selects only elements that carry an id, so
+    # there is no per-element check in Python.
     id_map = {}
-    for elem in root.iter():
-        xmi_id = elem.get(f"{{{ns['xmi']}}}id")
-        if xmi_id:
-            id_map[xmi_id] = elem
+    xmi_id_attr = f"{{{ns['xmi']}}}id"
+    id_elems = root.iterfind(".//*[@xmi:id]", ns)
+    if root.get(xmi_id_attr):
+        id_elems = itertools.chain((root,), id_elems)
+    for elem in id_elems:
+        id_map[elem.get(xmi_id_attr)] = elem.get('name') or elem.get('rolename') or "?"
 
     def get_element_name(elem_id):
-        if not elem_id or elem_id not in id_map:
+        if not elem_id:
             return "?"
-        elem = id_map[elem_id]
-        return elem.get('name') or elem.get('rolename') or "?"
-
-    def get_element_by_id(elem_id):
-        return id_map.get(elem_id)
+        return id_map.get(elem_id, "?")
 
     # Counters
     num_entities = 0
@@ -43,10 +149,17 @@ def generate_summary_stats(face_file_path):
     total_participants = 0
     
     # Graph for centrality
-    # Entity -> set of related things (associations it is in)
-    entity_connections = defaultdict(set)
-    # Association -> set of related things (participants)
-    association_connections = defaultdict(set)
+    # Every name gets an integer id; edges are kept as deduplicated (id, id)
+    # pairs since only the number of distinct connections per node is scored.
+    node_ids = {}
+
+    def node_id(name):
+        return node_ids.setdefault(name, len(node_ids))
+
+    # Entity -> related things (associations it is in)
+    entity_edges = set()
+    # Association -> related things (participants)
+    association_edges = set()
     
     # Also track composition counts per element for scoring
     entity_composition_counts = defaultdict(int)
@@ -66,23 +179,16 @@ def generate_summary_stats(face_file_path):
     for elem in root.iter():
         xmi_type = elem.get(f"{{{ns['xmi']}}}type", "")
         
-        if 'conceptual:Entity' in xmi_type:
+        if xmi_type in _ENTITY_TYPES:
             conceptual_entities.append(elem)
-        elif 'conceptual:Association' in xmi_type:
+            node_id(elem.get('name'))
+        elif xmi_type in _ASSOCIATION_TYPES:
             conceptual_associations.append(elem)
+            node_id(elem.get('name'))
 
     num_entities = len(conceptual_entities)
     num_associations = len(conceptual_associations)
     
-    # Formatting helper for compositions
-    def format_composition(rolename, type_name):
-        # If rolename is same as type_name (except for first letter case)
-        # e.g. identifier (Identifier) -> Identifier
-        if rolename and type_name:
-            if rolename == type_name or (len(rolename) > 0 and len(type_name) > 0 and rolename[0].lower() + rolename[1:] == type_name[0].lower() + type_name[1:]):
-                return type_name
-        return f"{rolename} ({type_name})"
-
     # Process Entities
     for entity in conceptual_entities:
         entity_name = entity.get('name')
@@ -93,7 +199,7 @@ def generate_summary_stats(face_file_path):
         count_comps = 0
         for comp in compositions:
             comp_type = comp.get(f"{{{ns['xmi']}}}type", "")
-            if 'conceptual:Composition' in comp_type:
+            if comp_type in _COMPOSITION_TYPES:
                 count_comps += 1
                 
                 # Get details
@@ -109,9 +215,9 @@ def generate_summary_stats(face_file_path):
         specializes_id = entity.get('specializes')
         if specializes_id:
             parent_name = get_element_name(specializes_id)
-            entity_connections[entity_name].add(parent_name)
+            entity_edges.add((node_id(entity_name), node_id(parent_name)))
             if parent_name != "?":
-                entity_connections[parent_name].add(entity_name)
+                entity_edges.add((node_id(parent_name), node_id(entity_name)))
 
     # Process Associations
     for assoc in conceptual_associations:
@@ -123,7 +229,7 @@ def generate_summary_stats(face_file_path):
         count_comps = 0
         for comp in compositions:
             comp_type = comp.get(f"{{{ns['xmi']}}}type", "")
-            if 'conceptual:Composition' in comp_type:
+            if comp_type in _COMPOSITION_TYPES:
                 count_comps += 1
                 
                 # Get details
@@ -140,7 +246,7 @@ def generate_summary_stats(face_file_path):
         count_parts = 0
         for part in participants:
             part_type = part.get(f"{{{ns['xmi']}}}type", "")
-            if 'conceptual:Participant' in part_type:
+            if part_type in _PARTICIPANT_TYPES:
                 count_parts += 1
                 
                 # Link Association to Entity
@@ -148,8 +254,8 @@ def generate_summary_stats(face_file_path):
                 entity_name = get_element_name(entity_ref_id)
                 
                 if entity_name != "?":
-                    association_connections[assoc_name].add(entity_name)
-                    entity_connections[entity_name].add(assoc_name)
+                    association_edges.add((node_id(assoc_name), node_id(entity_name)))
+                    entity_edges.add((node_id(entity_name), node_id(assoc_name)))
                     
                 # Get details
                 rolename = part.get('rolename')
@@ -189,58 +295,52 @@ def generate_summary_stats(face_file_path):
         total_participants += count_parts
 
     # Calculate Centrality Scores
-    best_entity = None
-    max_entity_score = -1
-    
-    for entity in conceptual_entities:
-        name = entity.get('name')
-        score = len(entity_connections[name]) + entity_composition_counts[name]
-        if score > max_entity_score:
-            max_entity_score = score
-            best_entity = name
-            
-    best_assoc = None
-    max_assoc_score = -1
-    
+    # Score = number of distinct connections + number of compositions
+    def degrees(edges):
+        counts = [0] * len(node_ids)
+        for a, _ in edges:
+            counts[a] += 1
+        return counts
+
+    entity_degrees = degrees(entity_edges)
+    association_degrees = degrees(association_edges)
+
+    def best_by_score(names, scores):
+        """Returns the first (name, score) with the highest score, or (None, -1)."""
+        if not names:
+            return None, -1
+        best_idx = max(range(len(scores)), key=scores.__getitem__)
+        return names[best_idx], scores[best_idx]
+
+    entity_names = [entity.get('name') for entity in conceptual_entities]
+    entity_scores = [entity_degrees[node_ids[name]] + entity_composition_counts[name] for name in entity_names]
+    best_entity, max_entity_score = best_by_score(entity_names, entity_scores)
+
+    assoc_names = [assoc.get('name') for assoc in conceptual_associations]
+    assoc_scores = [association_degrees[node_ids[name]] + association_composition_counts[name] for name in assoc_names]
+    best_assoc, max_assoc_score = best_by_score(assoc_names, assoc_scores)
+
     # Find representative observation and assembly associations
-    observe_assoc = None
-    assembly_assoc = None
-    
-    # Helper to calculate score for an association name
-    def get_assoc_score(name):
-        return len(association_connections[name]) + association_composition_counts[name]
+    def best_matching(pattern):
+        idxs = [i for i, name in enumerate(assoc_names) if pattern in name]
+        return best_by_score([assoc_names[i] for i in idxs], [assoc_scores[i] for i in idxs])[0]
 
-    for assoc in conceptual_associations:
-        name = assoc.get('name')
-        score = get_assoc_score(name)
-        
-        if score > max_assoc_score:
-            max_assoc_score = score
-            best_assoc = name
-            
-        # Check for Observe pattern
-        if "_Observe_" in name:
-            if observe_assoc is None or score > get_assoc_score(observe_assoc):
-                observe_assoc = name
-                
-        # Check for PartOf pattern
-        if "_PartOf_" in name:
-             if assembly_assoc is None or score > get_assoc_score(assembly_assoc):
-                assembly_assoc = name
+    observe_assoc = best_matching("_Observe_")
+    assembly_assoc = best_matching("_PartOf_")
 
     # Formatting helper
     def format_list(items):
         if not items:
             return "None"
         # Join with commas, escape underscores
-        return ", ".join(items).replace('_', '\\_')
+        return ", ".join(items).translate(_ESC)
     
     # Formatting helper for participants (one per line with indentation)
     def format_participants(items):
         if not items:
             return "None"
         # Format each participant on a new line with indentation, escape underscores
-        escaped_items = [item.replace('_', '\\_') for item in items]
+        escaped_items = [item.translate(_ESC) for item in items]
         if len(escaped_items) == 1:
             return escaped_items[0]
         # First item on same line, rest indented to align with text after "Participants: "
@@ -249,35 +349,21 @@ def generate_summary_stats(face_file_path):
         return escaped_items[0] + "".join(f"\\newline{indent}" + item for item in escaped_items[1:])
 
     # Prepare strings for best entity/assoc
-    best_entity_display = best_entity.replace('_', '\\_') if best_entity else 'N/A'
     entity_compositions_str = format_list(entity_composition_details[best_entity])
     
-    best_assoc_display = best_assoc.replace('_', '\\_') if best_assoc else 'N/A'
     assoc_compositions_str = format_list(association_composition_details[best_assoc])
     assoc_participants_str = format_participants(association_participant_details[best_assoc])
     
     # Prepare strings for Observation Pattern
-    observe_display = observe_assoc.replace('_', '\\_') if observe_assoc else 'N/A'
     observe_compositions_str = format_list(association_composition_details[observe_assoc]) if observe_assoc else "N/A"
     observe_participants_str = format_participants(association_participant_details[observe_assoc]) if observe_assoc else "N/A"
     
     # Prepare strings for Assembly Pattern
-    assembly_display = assembly_assoc.replace('_', '\\_') if assembly_assoc else 'N/A'
     assembly_compositions_str = format_list(association_composition_details[assembly_assoc]) if assembly_assoc else "N/A"
     assembly_participants_str = format_participants(association_participant_details[assembly_assoc]) if assembly_assoc else "N/A"
 
-    # Parse queries to count characteristics
-    import re
-    from query_parser import UDDLQueryParser
-
-    total_queries = 0
-    total_projected_characteristics = 0
-    total_entities_in_queries = 0
-    total_joins = 0
-    total_join_conditions = 0
-    
-    # Per-query statistics for complexity metrics
-    query_details = []
+    # Collect query specifications; they are parsed afterwards
+    specs = []
 
     for elem in root.iter():
         xmi_type = elem.get(f"{{{ns['xmi']}}}type", "")
@@ -288,117 +374,96 @@ def generate_summary_stats(face_file_path):
         
         # Strategy: Look for all 'specification' attributes or child elements
         # Or look for 'platform:Query' elements
-        if 'platform:Query' in xmi_type:
+        if xmi_type in _QUERY_TYPES:
              specification = elem.get('specification')
              if specification:
-                total_queries += 1
-                try:
-                    # Clean up query string if needed (e.g. remove XML entities if any, though ElementTree handles basics)
-                    parser = UDDLQueryParser(specification)
-                    ast = parser.parse()
-                    
-                    num_projections = len(ast.projections)
-                    num_entities = len(ast.from_clause.entities)
-                    num_joins = len(ast.from_clause.joins)
-                    num_join_conditions = sum(len(join.on) for join in ast.from_clause.joins)
-                    
-                    total_projected_characteristics += num_projections
-                    total_entities_in_queries += num_entities
-                    total_joins += num_joins
-                    total_join_conditions += num_join_conditions
-                    
-                    # Store per-query stats for complexity metrics
-                    query_details.append({
-                        'projections': num_projections,
-                        'entities': num_entities,
-                        'joins': num_joins,
-                        'join_conditions': num_join_conditions
-                    })
-                except Exception:
-                    # If parsing fails, just count the query but not characteristics
-                    pass
+                specs.append(specification)
         
         # Also check for 'query' tags if structure is different
         # Adjust based on actual .face file structure if needed. 
         # Assuming 'conceptual:Query' is the element type based on standard UDDL usage.
-    
+
+    total_queries = len(specs)
+    total_projected_characteristics = 0
+    total_entities_in_queries = 0
+    total_joins = 0
+    total_join_conditions = 0
+
+    # Per-query maximums for complexity metrics
+    max_projections_in_query = 0
+    max_entities_in_query = 0
+    max_joins_in_query = 0
+    max_join_conditions_in_query = 0
+
+    # Parse queries to count characteristics. Starting worker processes costs more
+    # than parsing a few queries, so the pool is only used for large models
+    if len(specs) < _MIN_QUERIES_FOR_POOL:
+        query_stats = [_parse_one(specification) for specification in specs]
+    else:
+        with ProcessPoolExecutor() as ex:
+            query_stats = list(ex.map(_parse_one, specs, chunksize=16))
+
+    for stats in query_stats:
+        if stats is None:
+            # If parsing failed, the query is counted but not its characteristics
+            continue
+        total_projected_characteristics += stats['projections']
+        total_entities_in_queries += stats['entities']
+        total_joins += stats['joins']
+        total_join_conditions += stats['join_conditions']
+
+        max_projections_in_query = max(max_projections_in_query, stats['projections'])
+        max_entities_in_query = max(max_entities_in_query, stats['entities'])
+        max_joins_in_query = max(max_joins_in_query, stats['joins'])
+        max_join_conditions_in_query = max(max_join_conditions_in_query, stats['join_conditions'])
+
     # Calculate query complexity metrics
     avg_projections_per_query = 0
     avg_entities_per_query = 0
     avg_joins_per_query = 0
     avg_join_conditions_per_query = 0
-    max_projections_in_query = 0
-    max_entities_in_query = 0
-    max_joins_in_query = 0
-    max_join_conditions_in_query = 0
     
     if total_queries > 0:
         avg_projections_per_query = total_projected_characteristics / total_queries
         avg_entities_per_query = total_entities_in_queries / total_queries
         avg_joins_per_query = total_joins / total_queries
         avg_join_conditions_per_query = total_join_conditions / total_queries
-        
-        for q_detail in query_details:
-            if q_detail['projections'] > max_projections_in_query:
-                max_projections_in_query = q_detail['projections']
-            if q_detail['entities'] > max_entities_in_query:
-                max_entities_in_query = q_detail['entities']
-            if q_detail['joins'] > max_joins_in_query:
-                max_joins_in_query = q_detail['joins']
-            if q_detail['join_conditions'] > max_join_conditions_in_query:
-                max_join_conditions_in_query = q_detail['join_conditions']
 
     # Generate LaTeX Table
     # Using tabularx and matching template style (gray header, no vertical lines)
-    script_name = pathlib.Path(__file__).name
-    latex_table = f"""
-% Generated by {script_name}
-% Arguments: face_file={face_file_path}
-\\begingroup
-    \\centering
-    \\begin{{table*}}[t]
-    \\renewcommand{{\\arraystretch}}{{1.5}}
-    \\begin{{tabularx}}{{\\textwidth}}{{@{{}} >{{\\sffamily\\raggedright\\arraybackslash}}p{{0.35\\textwidth}} >{{\\sffamily\\raggedright\\arraybackslash}}X @{{}}}}
-        \\rowcolor{{tableheader}}
-        \\headingfont\\bfseries UDDL Data Model Statistics & \\headingfont\\bfseries Model Examples \\\\
-        \\addlinespace[4pt]
-        % Left Column: Statistics
-        \\begin{{tabular}}[t]{{@{{}}l r@{{}}}}
-            Number of Entities: & {num_entities} \\\\
-            Number of Associations: & {num_associations} \\\\
-            Total Compositions: & {total_compositions} \\\\
-            Total Participants: & {total_participants} \\\\
-            Total Queries: & {total_queries} \\\\
-            Total Projected Characteristics: & {total_projected_characteristics} \\\\
-            Avg Projections/Query: & {avg_projections_per_query:.1f} \\\\
-            Avg Entities/Query: & {avg_entities_per_query:.1f} \\\\
-            Avg Join Conditions/Query: & {avg_join_conditions_per_query:.1f} \\\\
-            Max Projections: & {max_projections_in_query} \\\\
-            Max Join Conditions: & {max_join_conditions_in_query}
-        \\end{{tabular}}
-        &
-        % Right Column: Examples
-        \\textbf{{Most Central Entity}}: {best_entity_display} (Score: {max_entity_score}) \\newline
-        \\textit{{Compositions}}: {entity_compositions_str} \\par\\vspace{{6pt}}
-        
-        \\textbf{{Most Central Association}}: {best_assoc_display} (Score: {max_assoc_score}) \\newline
-        \\textit{{Compositions}}: {assoc_compositions_str} \\newline
-        \\textit{{Participants}}: {assoc_participants_str} \\par\\vspace{{6pt}}
-        
-        \\textbf{{Observation Pattern}}: {observe_display} \\newline
-        \\textit{{Compositions}}: {observe_compositions_str} \\newline
-        \\textit{{Participants}}: {observe_participants_str} \\par\\vspace{{6pt}}
-        
-        \\textbf{{Assembly Pattern}}: {assembly_display} \\newline
-        \\textit{{Compositions}}: {assembly_compositions_str} \\newline
-        \\textit{{Participants}}: {assembly_participants_str}
-    \\end{{tabularx}}
-    \\caption{{Summary statistics of the UDDL Conceptual Data Model (CDM). The table presents the total counts of core modeling elements: Entities, Associations, Compositions, and Participants, as well as Query statistics including complexity metrics (averages and maximums for projections, entities, JOINs, and join conditions per query). It identifies the most central elements based on their structural connectivity and property density. Additionally, it highlights representative associations for the Observation pattern (\\textit{{Observe}}) and the Assembly pattern (\\textit{{PartOf}}) with their respective compositions and participants.}}
-    \\label{{tab:uddl_summary}}
-    \\end{{table*}}
-\\endgroup
-"""
+    stats = {
+        'script_name': pathlib.Path(__file__).name,
+        'face_file_path': face_file_path,
+        'num_entities': num_entities,
+        'num_associations': num_associations,
+        'total_compositions': total_compositions,
+        'total_participants': total_participants,
+        'total_queries': total_queries,
+        'total_projected_characteristics': total_projected_characteristics,
+        'avg_projections_per_query': avg_projections_per_query,
+        'avg_entities_per_query': avg_entities_per_query,
+        'avg_join_conditions_per_query': avg_join_conditions_per_query,
+        'max_projections_in_query': max_projections_in_query,
+        'max_entities_in_query': max_entities_in_query,
+        'max_joins_in_query': max_joins_in_query,
+        'max_join_conditions_in_query': max_join_conditions_in_query,
+        'best_entity_display': esc(best_entity),
+        'max_entity_score': max_entity_score,
+        'entity_compositions_str': entity_compositions_str,
+        'best_assoc_display': esc(best_assoc),
+        'max_assoc_score': max_assoc_score,
+        'assoc_compositions_str': assoc_compositions_str,
+        'assoc_participants_str': assoc_participants_str,
+        'observe_display': esc(observe_assoc),
+        'observe_compositions_str': observe_compositions_str,
+        'observe_participants_str': observe_participants_str,
+        'assembly_display': esc(assembly_assoc),
+        'assembly_compositions_str': assembly_compositions_str,
+        'assembly_participants_str': assembly_participants_str,
+    }
+    latex_table = _TEMPLATE.format_map(stats)
     print(latex_table)
+    return stats
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
@@ -1,5 +1,6 @@
 import re
-from typing import List, Union
+import sys
+from typing import List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
 
 
@@ -25,13 +26,27 @@ Resolution = Union[EntityResolution, AssociationResolution]
 
 
 class ParticipantPath:
-    def __init__(self, start_type: str, resolutions: List[Resolution]):
+    __slots__ = ('start_type', 'resolutions', '_str')
+
+    def __init__(self, start_type: str, resolutions: Sequence[Resolution]):
         self.start_type = start_type
-        self.resolutions = resolutions
+        # Stored as a tuple so paths are immutable and hashable, and a path can be
+        # extended or sliced into prefixes without copying through a list
+        self.resolutions: Tuple[Resolution, ...] = tuple(resolutions)
+        # Rendered lazily by __str__
+        self._str: Optional[str] = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ParticipantPath):
+            return NotImplemented
+        return self.start_type == other.start_type and self.resolutions == other.resolutions
+
+    def __hash__(self) -> int:
+        return hash((self.start_type, self.resolutions))
 
     @staticmethod
     def parse(text: str) -> 'ParticipantPath':
-        resolutions = []
+        resolutions: List[Resolution] = []
         pos = 0
         n = len(text)
         
@@ -44,7 +59,7 @@ class ParticipantPath:
         if not start_type_match:
              raise ValueError("Input string must start with a valid identifier (start_type).")
         
-        start_type = start_type_match.group(1)
+        start_type = sys.intern(start_type_match.group(1))
         pos = start_type_match.end()
         
         # compiled regexes for performance
@@ -60,8 +75,8 @@ class ParticipantPath:
                 if not match:
                     raise ValueError(f"Invalid association resolution starting at index {pos}. Expected ->rolename[assoc_name]")
                 
-                rolename = match.group(1)
-                assoc_name = match.group(2)
+                rolename = sys.intern(match.group(1))
+                assoc_name = sys.intern(match.group(2))
                 resolutions.append(AssociationResolution(rolename, assoc_name))
                 pos = match.end()
                 
@@ -70,7 +85,7 @@ class ParticipantPath:
                 if not match:
                     raise ValueError(f"Invalid entity resolution starting at index {pos}. Expected .rolename")
                 
-                rolename = match.group(1)
+                rolename = sys.intern(match.group(1))
                 resolutions.append(EntityResolution(rolename))
                 pos = match.end()
                 
@@ -86,15 +101,16 @@ class ParticipantPath:
         return ParticipantPath(start_type, resolutions)
 
     def __str__(self) -> str:
-        return f"{self.start_type}" + "".join(str(res) for res in self.resolutions)
+        if self._str is None:
+            self._str = f"{self.start_type}" + "".join(map(str, self.resolutions))
+        return self._str
 
     def __repr__(self) -> str:
-        return f"ParticipantPath(start_type='{self.start_type}', resolutions={self.resolutions})"
+        return f"ParticipantPath(start_type='{self.start_type}', resolutions={list(self.resolutions)})"
 
 
 if __name__ == "__main__":
     import argparse
-    import sys
 
     parser = argparse.ArgumentParser(description="Parse a UDDL participant path.")
     parser.add_argument("path", help="The participant path string to parse")
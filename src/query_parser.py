@@ -1,6 +1,8 @@
+import functools
 import re
+import sys
 from dataclasses import dataclass
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 
 @dataclass(frozen=True)
@@ -37,6 +39,10 @@ class EntityWildcard:
         return f"{self.entity}.*"
 
 
+# AllCharacteristics is stateless, so every SELECT * shares this instance
+ALL_CHARACTERISTICS = AllCharacteristics()
+_ALL_PROJECTIONS = (ALL_CHARACTERISTICS,)
+
 Projection = Union[ProjectedCharacteristic, AllCharacteristics, EntityWildcard]
 
 
@@ -65,7 +71,7 @@ class Equivalence:
 @dataclass(frozen=True)
 class Join:
     target: Entity
-    on: List[Equivalence]
+    on: Tuple[Equivalence, ...]
 
     def __str__(self) -> str:
         return f"JOIN {self.target} ON {' AND '.join(str(e) for e in self.on)}"
@@ -73,8 +79,8 @@ class Join:
 
 @dataclass(frozen=True)
 class FromClause:
-    entities: List[Entity]
-    joins: List[Join]
+    entities: Tuple[Entity, ...]
+    joins: Tuple[Join, ...]
 
     def __str__(self) -> str:
         res = f"FROM {', '.join(str(e) for e in self.entities)}"
@@ -85,7 +91,7 @@ class FromClause:
 
 @dataclass(frozen=True)
 class QueryStatement:
-    projections: List[Projection]
+    projections: Tuple[Projection, ...]
     from_clause: FromClause
     qualifier: Optional[str] = None
 
@@ -96,180 +102,271 @@ class QueryStatement:
     def pretty_print(self, indent: int = 0) -> str:
         """Pretty-prints the query with readable indentation."""
         indent_str = " " * indent
-        lines = []
-        
+        buf: List[str] = []
+        append = buf.append
+
         # SELECT clause
-        select_parts = ["SELECT"]
-        if self.qualifier:
-            select_parts.append(self.qualifier)
-        select_base = " ".join(select_parts)
-        
+        select_base = f"SELECT {self.qualifier}" if self.qualifier else "SELECT"
+
         # Projections with proper indentation
-        if len(self.projections) == 1:
-            lines.append(f"{select_base} {str(self.projections[0])}")
+        projections = list(map(str, self.projections))
+        if len(projections) == 1:
+            append(f"{select_base} {projections[0]}")
         else:
             # Multi-line projections
-            for i, proj in enumerate(self.projections):
+            prefix = " " * (len(select_base) + 1)
+            last = len(projections) - 1
+            for i, proj in enumerate(projections):
                 if i == 0:
-                    lines.append(f"{select_base} {proj},")
+                    append(f"{select_base} {proj},")
+                elif i < last:
+                    append(f"{prefix}{proj},")
                 else:
-                    prefix = " " * (len(select_base) + 1)
-                    suffix = "," if i < len(self.projections) - 1 else ""
-                    lines.append(f"{prefix}{proj}{suffix}")
-        
+                    append(prefix + proj)
+
         # FROM clause
-        from_line = f"FROM {', '.join(str(e) for e in self.from_clause.entities)}"
-        lines.append(from_line)
-        
-        # JOIN clauses with indentation
+        append("FROM " + ", ".join(map(str, self.from_clause.entities)))
+
+        # JOIN clauses, with the ON conditions indented beneath them
         for join in self.from_clause.joins:
-            join_line = f"JOIN {join.target}"
-            lines.append(join_line)
-            
-            # ON clause with conditions
-            if join.on:
-                for i, eq in enumerate(join.on):
-                    if i == 0:
-                        lines.append(f"    ON {eq}")
-                    else:
-                        lines.append(f"    AND {eq}")
-        
-        return "\n".join(f"{indent_str}{line}" for line in lines)
+            append(f"JOIN {join.target}")
+            on = join.on
+            if on:
+                append(f"    ON {on[0]}")
+                for eq in on[1:]:
+                    append(f"    AND {eq}")
+
+        return indent_str + ("\n" + indent_str).join(buf)
+
+
+# Token kinds, interned so the parser can compare them by identity
+_SELECT = sys.intern('SELECT')
+_FROM = sys.intern('FROM')
+_JOIN = sys.intern('JOIN')
+_ON = sys.intern('ON')
+_AND = sys.intern('AND')
+_AS = sys.intern('AS')
+_ALL = sys.intern('ALL')
+_ID = sys.intern('ID')
+_ASTERISK = sys.intern('ASTERISK')
+_PERIOD = sys.intern('PERIOD')
+_COMMA = sys.intern('COMMA')
+_EQUALS = sys.intern('EQUALS')
+
+# Lookup tables for the hand-written scanner
+_KEYWORDS: Dict[str, str] = {kind: kind for kind in (_SELECT, _FROM, _JOIN, _ON, _AND, _AS, _ALL)}
+_PUNCTUATION: Dict[str, str] = {'*': _ASTERISK, '.': _PERIOD, ',': _COMMA, '=': _EQUALS}
+
+# Words and punctuation for the non-ASCII fallback in UDDLQueryParser._tokenize.
+# Keywords are words looked up in _KEYWORDS, and everything else is skipped.
+# IGNORECASE also lets the word classes match the non-ASCII letters that case-fold
+# onto ASCII ones (e.g. the dotless i and the Kelvin sign).
+_TOK_RE = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*|[*.,=]', re.IGNORECASE)
+
+
+# Character classes for the ASCII scanner, indexed by byte value
+_CLASS_OTHER = 0
+_CLASS_WORD_START = 1
+_CLASS_DIGIT = 2
+_CLASS_PUNCTUATION = 3
+_CHAR_CLASSES = bytes(
+    _CLASS_WORD_START if b < 128 and (chr(b).isalpha() or b == ord('_'))
+    else _CLASS_DIGIT if b < 128 and chr(b).isdigit()
+    else _CLASS_PUNCTUATION if chr(b) in _PUNCTUATION
+    else _CLASS_OTHER
+    for b in range(256)
+)
+
+
+def _tokenize_fast(text: str) -> Tuple[List[str], List[str]]:
+    """
+    Scans ASCII query text into parallel (kinds, values) lists.
+    Characters outside the grammar are skipped, and a keyword only counts as one
+    when it starts on a word boundary.
+    The text is first mapped to a string of character classes with one
+    bytes.translate call, so the loop below only compares small integers.
+    """
+    classes = text.encode('ascii').translate(_CHAR_CLASSES)
+    kinds: List[str] = []
+    values: List[str] = []
+    i = 0
+    n = len(classes)
+    while i < n:
+        c = classes[i]
+        if c == _CLASS_WORD_START:
+            j = i + 1
+            while j < n and (c := classes[j]) != _CLASS_OTHER and c != _CLASS_PUNCTUATION:
+                j += 1
+            word = text[i:j]
+            kind = _ID
+            if i == 0 or not (_CLASS_OTHER < classes[i - 1] < _CLASS_PUNCTUATION):
+                kind = _KEYWORDS.get(word.upper(), _ID)
+            kinds.append(kind)
+            # Identifiers recur throughout a query and its downstream lookups
+            values.append(sys.intern(word) if kind is _ID else word)
+            i = j
+        else:
+            if c == _CLASS_PUNCTUATION:
+                ch = text[i]
+                kinds.append(_PUNCTUATION[ch])
+                values.append(ch)
+            i += 1
+    return kinds, values
+
+
+def _is_word_char(c):
+    # What \w matches in a str pattern
+    return c.isalnum() or c == '_'
+
+
+def _pooled_reference(pool, entity, characteristic):
+    key = (entity, characteristic)
+    ref = pool.get(key)
+    if ref is None:
+        ref = pool[key] = Reference(entity=entity, characteristic=characteristic)
+    return ref
+
+
+def _unexpected(expected_kind, kind):
+    return SyntaxError(f"Expected {expected_kind}, got {kind}")
 
 
 class UDDLQueryParser:
     def __init__(self, query_text):
-        self.tokens = self._tokenize(query_text)
+        # Token kinds and values are kept in parallel lists
+        self.kinds, self.values = self._tokenize(query_text)
+        # A trailing None token lets every lookahead index without a bounds check
+        self.kinds.append(None)
+        self.values.append(None)
         self.pos = 0
+        # Equal references share one node, e.g. a.id in several join conditions
+        self._ref_pool = {}
 
     def _tokenize(self, text):
-        token_specification = [
-            ('SELECT',   r'\bSELECT\b'),
-            ('FROM',     r'\bFROM\b'),
-            ('JOIN',     r'\bJOIN\b'),
-            ('ON',       r'\bON\b'),
-            ('AND',      r'\bAND\b'),
-            ('AS',       r'\bAS\b'),
-            ('ALL',      r'\bALL\b'),
-            ('ID',       r'[a-zA-Z_][a-zA-Z0-9_]*'),
-            ('ASTERISK', r'\*'),
-            ('PERIOD',   r'\.'),
-            ('COMMA',    r','),
-            ('EQUALS',   r'='),
-            ('SKIP',     r'[ \t\n]+'),
-        ]
-        tok_regex = '|'.join('(?P<%s>%s)' % pair for pair in token_specification)
-        tokens = []
-        for mo in re.finditer(tok_regex, text, re.IGNORECASE):
-            kind = mo.lastgroup
-            if kind != 'SKIP':
-                tokens.append((kind, mo.group()))
-        return tokens
-
-    def _peek(self, offset=0):
-        idx = self.pos + offset
-        return self.tokens[idx] if idx < len(self.tokens) else (None, None)
+        if text.isascii():
+            return _tokenize_fast(text)
+        # Non-ASCII input keeps the regex's Unicode case-insensitive matching,
+        # and keywords need a Unicode word boundary on both sides
+        kinds = []
+        values = []
+        n = len(text)
+        for mo in _TOK_RE.finditer(text):
+            value = mo.group()
+            kind = _PUNCTUATION.get(value)
+            if kind is None:
+                start, end = mo.span()
+                kind = _ID
+                if not (start and _is_word_char(text[start - 1])) and not (end < n and _is_word_char(text[end])):
+                    # str.upper leaves the dotted capital I alone
+                    kind = _KEYWORDS.get(value.upper().replace('\u0130', 'I'), _ID)
+                if kind is _ID:
+                    value = sys.intern(value)
+            kinds.append(kind)
+            values.append(value)
+        return kinds, values
+
+    def _peek(self):
+        return self.kinds[self.pos]
 
     def _consume(self, expected_kind=None):
-        kind, value = self._peek()
-        if expected_kind and kind != expected_kind:
-            raise SyntaxError(f"Expected {expected_kind}, got {kind}")
-        self.pos += 1
-        return value
+        pos = self.pos
+        kind = self.kinds[pos]
+        if expected_kind and kind is not expected_kind:
+            raise _unexpected(expected_kind, kind)
+        if kind is not None:
+            self.pos = pos + 1
+        return self.values[pos]
+
+    def _intern_ref(self, entity, characteristic):
+        return _pooled_reference(self._ref_pool, entity, characteristic)
 
     def parse(self) -> QueryStatement:
-        self._consume('SELECT')
-        qualifier = self._consume('ALL') if self._peek()[0] == 'ALL' else None
+        self._consume(_SELECT)
+        qualifier = self._consume(_ALL) if self._peek() is _ALL else None
         projected = self.parse_projected_list()
         from_clause = self.parse_from_clause()
         return QueryStatement(qualifier=qualifier, projections=projected, from_clause=from_clause)
 
-    def parse_projected_list(self) -> List[Projection]:
-        if self._peek()[0] == 'ASTERISK':
-            self._consume('ASTERISK')
-            return [AllCharacteristics()]
-        projections = []
-        while True:
+    def parse_projected_list(self) -> Tuple[Projection, ...]:
+        if self._peek() is _ASTERISK:
+            self._consume(_ASTERISK)
+            return _ALL_PROJECTIONS
+        projections = [self.parse_projected_expression()]
+        while self._peek() is _COMMA:
+            self._consume(_COMMA)
             projections.append(self.parse_projected_expression())
-            if self._peek()[0] == 'COMMA':
-                self._consume('COMMA')
-            else:
-                break
-        return projections
+        return tuple(projections)
 
     def parse_projected_expression(self) -> Projection:
-        first_id = self._consume('ID')
-        if self._peek()[0] == 'PERIOD':
-            self._consume('PERIOD')
-            if self._peek()[0] == 'ASTERISK':
-                self._consume('ASTERISK')
+        first_id = self._consume(_ID)
+        if self._peek() is _PERIOD:
+            self._consume(_PERIOD)
+            if self._peek() is _ASTERISK:
+                self._consume(_ASTERISK)
                 return EntityWildcard(entity=first_id)
-            char_name = self._consume('ID')
-            ref = Reference(entity=first_id, characteristic=char_name)
+            ref = self._intern_ref(first_id, self._consume(_ID))
         else:
             # In SELECT, a standalone ID is a characteristic of the root entity
-            ref = Reference(entity=None, characteristic=first_id)
+            ref = self._intern_ref(None, first_id)
+        return ProjectedCharacteristic(reference=ref, alias=self.parse_alias())
 
-        alias = None
-        if self._peek()[0] == 'AS':
-            self._consume('AS')
-            alias = self._consume('ID')
-        elif self._peek()[0] == 'ID' and self._peek()[0] not in ('FROM', 'JOIN'):
-            alias = self._consume('ID')
-        return ProjectedCharacteristic(reference=ref, alias=alias)
+    def parse_alias(self) -> Optional[str]:
+        if self._peek() is _AS:
+            self._consume(_AS)
+            return self._consume(_ID)
+        if self._peek() is _ID:
+            return self._consume(_ID)
+        return None
 
     def parse_from_clause(self) -> FromClause:
-        self._consume('FROM')
-        entities = [self.parse_selected_entity()]
+        self._consume(_FROM)
+        entities = (self.parse_selected_entity(),)
         joins = []
-        while self._peek()[0] == 'JOIN':
+        while self._peek() is _JOIN:
             joins.append(self.parse_join_expression())
-        return FromClause(entities=entities, joins=joins)
+        return FromClause(entities=entities, joins=tuple(joins))
 
     def parse_selected_entity(self) -> Entity:
-        name = self._consume('ID')
-        alias = None
-        if self._peek()[0] == 'AS':
-            self._consume('AS')
-            alias = self._consume('ID')
-        elif self._peek()[0] == 'ID' and self._peek()[0] not in ('JOIN', 'SELECT', 'FROM'):
-            alias = self._consume('ID')
-        return Entity(name=name, alias=alias)
+        name = self._consume(_ID)
+        return Entity(name=name, alias=self.parse_alias())
 
     def parse_join_expression(self) -> Join:
-        self._consume('JOIN')
+        self._consume(_JOIN)
         entity = self.parse_selected_entity()
-        self._consume('ON')
+        self._consume(_ON)
         return Join(target=entity, on=self.parse_join_criteria())
 
-    def parse_join_criteria(self) -> List[Equivalence]:
-        conditions = []
-        while True:
+    def parse_join_criteria(self) -> Tuple[Equivalence, ...]:
+        conditions = [self.parse_equivalence_expression()]
+        while self._peek() is _AND:
+            self._consume(_AND)
             conditions.append(self.parse_equivalence_expression())
-            if self._peek()[0] == 'AND':
-                self._consume('AND')
-            else:
-                break
-        return conditions
+        return tuple(conditions)
 
     def parse_equivalence_expression(self) -> Equivalence:
         left = self.parse_operand()
         right = None
-        if self._peek()[0] == 'EQUALS':
-            self._consume('EQUALS')
+        if self._peek() is _EQUALS:
+            self._consume(_EQUALS)
             right = self.parse_operand()
         return Equivalence(left=left, right=right)
 
     def parse_operand(self) -> Reference:
-        first = self._consume('ID')
-        if self._peek()[0] == 'PERIOD':
-            self._consume('PERIOD')
-            return Reference(entity=first, characteristic=self._consume('ID'))
+        first = self._consume(_ID)
+        if self._peek() is _PERIOD:
+            self._consume(_PERIOD)
+            return self._intern_ref(first, self._consume(_ID))
         # In JOIN, a standalone ID is an Entity Alias (Identity)
-        return Reference(entity=first, characteristic=None)
+        return self._intern_ref(first, None)
 
 
+@functools.lru_cache(maxsize=1024)
 def get_ast(query_string):
+    """
+    Parses a UDDL query string into a QueryStatement.
+    Results are cached per query string, so the returned AST is shared between
+    callers and must be treated as immutable.
+    """
     return UDDLQueryParser(query_string).parse()
 
 
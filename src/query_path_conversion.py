@@ -29,15 +29,18 @@ The alias map is primarily used to solve two problems in the translation process
   the .attr resolution to create the final terminal path.
 """
 
-from typing import List, Union, Dict, Tuple
+from collections import defaultdict
+from itertools import product
+from typing import Iterable, List, Optional, Sequence, Union, Dict, Set, Tuple
 import argparse
 import pathlib
+import sys
 import xml.etree.ElementTree as ET
 
 from tuple import UddlTuple
 from parse_tuple import parse_tuple
 from uddl2tuple import uddl2tuple
-from participant_path_parser import EntityResolution, AssociationResolution, ParticipantPath
+from participant_path_parser import EntityResolution, AssociationResolution, ParticipantPath, Resolution
 from query_parser import (
     QueryStatement, FromClause, Entity, Join, Equivalence, Reference,
     ProjectedCharacteristic, AllCharacteristics, EntityWildcard, get_ast
@@ -77,21 +80,86 @@ class PathUnion:
 ProjectedPath = Union[ParticipantPath, PathUnion]
 
 
+class ModelIndex(list):
+    """
+    The tuples of a model, plus lookup tables over them built in a single pass.
+    Functions taking a model accept either a plain list of tuples or a ModelIndex;
+    passing an index saves rebuilding the tables on every call. The tables are
+    not updated if the list is modified afterwards.
+    """
+    def __init__(self, tuples: Iterable[UddlTuple] = ()) -> None:
+        super().__init__(tuples)
+        attributes: Dict[str, Set[str]] = defaultdict(set)
+        # (subject, rolename) -> object; the first matching tuple wins, as in a scan
+        self.targets: Dict[Tuple[str, str], str] = {}
+        # (subject, rolename) -> the first matching tuple, for callers that need
+        # its object unconverted (it may be a ParticipantPath)
+        self.tuples: Dict[Tuple[str, str], UddlTuple] = {}
+        # (subject, rolename) -> object of the first 'composes' tuple naming a type
+        self.compositions: Dict[Tuple[str, str], str] = {}
+        for t in self:
+            # Names are interned like the query parser's identifiers, so lookups
+            # with names taken from a parsed query compare by identity
+            subject, rolename = sys.intern(t.subject), sys.intern(t.rolename)
+            key = (subject, rolename)
+            if t.predicate == 'composes':
+                attributes[subject].add(rolename)
+                if isinstance(t.object, str):
+                    self.compositions.setdefault(key, t.object)
+            self.targets.setdefault(key, sys.intern(str(t.object)))
+            self.tuples.setdefault(key, t)
+        # Attribute rolenames of each entity type, sorted once and shared read-only
+        self.attributes: Dict[str, Tuple[str, ...]] = {k: tuple(sorted(v)) for k, v in attributes.items()}
+
+    def target(self, subject: str, rolename: str) -> Optional[str]:
+        """The object of the first tuple with this subject and rolename, if any."""
+        return self.targets.get((subject, rolename))
+
+
+def index_model(model: Optional[List[UddlTuple]]) -> Optional[ModelIndex]:
+    """Returns model as a ModelIndex, indexing it only if it is a plain list."""
+    if model is None or isinstance(model, ModelIndex):
+        return model
+    return ModelIndex(model)
+
+
 def get_model_attributes(model: List[UddlTuple], type_name: str) -> List[str]:
     """
     Finds all attribute rolenames for a given entity type from the model.
     Attributes are identified by the 'composes' predicate.
     """
-    attributes = set()
-    
-    for t in model:
-        if t.subject == type_name and t.predicate == 'composes':
-            attributes.add(t.rolename)
-            
-    return sorted(list(attributes))
+    index = index_model(model)
+    return list(index.attributes.get(type_name, ())) if index else []
+
+
+def _is_identity(ref: Optional[Reference]) -> bool:
+    """True if ref names an entity itself (no characteristic) rather than one of its characteristics."""
+    return ref is not None and (ref.characteristic is None or ref.characteristic == "")
+
+
+def _join_rule(left_known: bool, right_known: bool, left_identity: bool, right_identity: bool,
+               left_is_target: bool, right_is_target: bool):
+    """
+    The first join-condition shape matched, as (source alias is on the left, resolution class,
+    rolename is on the left), or None if the condition does not extend a path.
+    """
+    if left_known and right_is_target and right_identity:
+        return True, EntityResolution, True
+    if right_known and left_is_target and left_identity:
+        return False, EntityResolution, False
+    if left_is_target and right_known and right_identity:
+        return False, AssociationResolution, True
+    if right_is_target and left_known and left_identity:
+        return True, AssociationResolution, False
+    return None
+
+
+# (left alias joined, right alias joined, left is identity, right is identity,
+#  left is target, right is target) -> _join_rule for every binary join condition
+_JOIN_RULES = {key: _join_rule(*key) for key in product((False, True), repeat=6)}
 
 
-def query2path(query_ast: QueryStatement, model: List[UddlTuple] = None) -> Tuple[Dict[str, List[ParticipantPath]], List[ProjectedPath]]:
+def query2path(query_ast: QueryStatement, model: Optional[List[UddlTuple]] = None) -> Tuple[Dict[str, List[ParticipantPath]], List[ProjectedPath]]:
     """
     Maps a UDDL Query to (alias_map, projected_paths).
     
@@ -104,6 +172,7 @@ def query2path(query_ast: QueryStatement, model: List[UddlTuple] = None) -> Tupl
     from_clause = query_ast.from_clause
     if not from_clause.entities:
         return {}, []
+    model = index_model(model)
 
     root_entity = from_clause.entities[0]
     start_type = root_entity.name
@@ -111,6 +180,10 @@ def query2path(query_ast: QueryStatement, model: List[UddlTuple] = None) -> Tupl
 
     alias_map: Dict[str, List[ParticipantPath]] = {root_alias: [ParticipantPath(start_type, [])]}
     alias_types = {root_alias: start_type}
+    # Resolutions of each path in alias_map as a tuple, kept per alias in an
+    # insertion-ordered dict (same order as alias_map), so a new path's key is
+    # its parent's plus one resolution and deduplication is a dict lookup
+    path_keys: Dict[str, Dict[Tuple[Resolution, ...], None]] = {root_alias: {(): None}}
 
     # 1. Build the JOIN graph (alias_map)
     for join in from_clause.joins:
@@ -118,40 +191,46 @@ def query2path(query_ast: QueryStatement, model: List[UddlTuple] = None) -> Tupl
         target_type = join.target.name
         alias_types[target_alias] = target_type
         
-        if target_alias not in alias_map:
-            alias_map[target_alias] = []
+        # The target's paths and keys, extended in place by each condition below
+        target_paths = alias_map.setdefault(target_alias, [])
+        target_keys = path_keys.setdefault(target_alias, {})
 
         for cond in join.on:
             left, right = cond.left, cond.right
-            
-            def is_identity(ref):
-                return ref is not None and (ref.characteristic is None or ref.characteristic == "")
-
             left_alias = left.entity or root_alias
-            right_alias = right.entity if right else None
             
-            found_res = None
-            source_alias = None
+            found_res: Optional[Resolution] = None
+            source_alias: Optional[str] = None
 
             if right is None: # Unary JOIN
-                source_alias, found_res = left_alias, EntityResolution(left.characteristic, target_type)
-            elif left_alias in alias_map and right_alias == target_alias and is_identity(right):
-                source_alias, found_res = left_alias, EntityResolution(left.characteristic, target_type)
-            elif right_alias in alias_map and left_alias == target_alias and is_identity(left):
-                source_alias, found_res = right_alias, EntityResolution(right.characteristic, target_type)
-            elif left_alias == target_alias and right_alias in alias_map and is_identity(right):
-                source_alias, found_res = right_alias, AssociationResolution(left.characteristic, target_type)
-            elif right_alias == target_alias and left_alias in alias_map and is_identity(left):
-                source_alias, found_res = left_alias, AssociationResolution(right.characteristic, target_type)
-
-            if found_res and source_alias in alias_map:
-                for parent_path in alias_map[source_alias]:
-                    new_path = ParticipantPath(start_type, list(parent_path.resolutions) + [found_res])
-                    if str(new_path) not in [str(p) for p in alias_map[target_alias]]:
-                        alias_map[target_alias].append(new_path)
+                # An identity-only condition (JOIN B ON A) names no rolename to
+                # navigate, so it adds no path rather than a path through "None"
+                if left_alias in alias_map and left.characteristic:
+                    source_alias, found_res = left_alias, EntityResolution(left.characteristic, target_type)
+            else:
+                # Every rule requires its source alias to be joined already
+                right_alias = right.entity
+                rule = _JOIN_RULES[(left_alias in alias_map, right_alias in alias_map,
+                                    _is_identity(left), _is_identity(right),
+                                    left_alias == target_alias, right_alias == target_alias)]
+                if rule is not None:
+                    source_is_left, resolution_cls, rolename_is_left = rule
+                    source_alias = left_alias if source_is_left else right_alias
+                    found_res = resolution_cls((left if rolename_is_left else right).characteristic, target_type)
+
+            if found_res is not None and source_alias is not None:
+                source_keys: Iterable[Tuple[Resolution, ...]] = path_keys[source_alias]
+                if source_alias == target_alias:
+                    # Self-join: extend only the paths that existed before this condition
+                    source_keys = list(source_keys)
+                for parent_key in source_keys:
+                    new_key = parent_key + (found_res,)
+                    if new_key not in target_keys:
+                        target_keys[new_key] = None
+                        target_paths.append(ParticipantPath(start_type, new_key))
 
     # 2. Build projected characteristic paths
-    projected_paths = []
+    projected_paths: List[ProjectedPath] = []
 
     for proj in query_ast.projections:
         if isinstance(proj, ProjectedCharacteristic):
@@ -180,18 +259,11 @@ def query2path(query_ast: QueryStatement, model: List[UddlTuple] = None) -> Tupl
 
             # Step B: Generate paths for this projection
             # Collect all possible paths across all matching aliases
-            all_paths_for_projection = []
-            seen_path_strings = set()
-            
-            for t_alias in target_aliases:
-                # For Case 1: Collect ALL paths for this alias (not just the first)
-                # This represents the union of possible paths due to AND joins
-                for base_path in alias_map[t_alias]:
-                    full_path = ParticipantPath(start_type, list(base_path.resolutions) + [EntityResolution(attr)])
-                    path_str = str(full_path)
-                    if path_str not in seen_path_strings:
-                        all_paths_for_projection.append(full_path)
-                        seen_path_strings.add(path_str)
+            attr_res = EntityResolution(attr)
+            # For Case 1: Collect ALL paths for each alias (not just the first)
+            # This represents the union of possible paths due to AND joins
+            projection_keys = dict.fromkeys(base_key + (attr_res,) for t_alias in target_aliases for base_key in path_keys[t_alias])
+            all_paths_for_projection = [ParticipantPath(start_type, key) for key in projection_keys]
             
             # Add the projection: use PathUnion if multiple paths, single path otherwise
             if len(all_paths_for_projection) == 0:
@@ -207,31 +279,24 @@ def query2path(query_ast: QueryStatement, model: List[UddlTuple] = None) -> Tupl
             
             if target_alias in alias_map and target_alias in alias_types:
                 type_name = alias_types[target_alias]
-                attributes = get_model_attributes(model, type_name)
-                for attr in attributes:
-                    # Collect all paths for this attribute (Case 1: handle multiple paths)
-                    all_paths_for_attr = []
-                    seen_path_strings = set()
-                    
-                    for base_path in alias_map[target_alias]:
-                        full_path = ParticipantPath(start_type, list(base_path.resolutions) + [EntityResolution(attr)])
-                        path_str = str(full_path)
-                        if path_str not in seen_path_strings:
-                            all_paths_for_attr.append(full_path)
-                            seen_path_strings.add(path_str)
-                    
-                    # Add the projection: use PathUnion if multiple paths
-                    if len(all_paths_for_attr) == 0:
-                        continue
-                    elif len(all_paths_for_attr) == 1:
-                        projected_paths.append(all_paths_for_attr[0])
-                    else:
-                        projected_paths.append(PathUnion(all_paths_for_attr))
+                attributes = model.attributes.get(type_name, ())
+                # Every attribute is reached through the same (already unique) paths to
+                # the alias, so whether its projection is a PathUnion (Case 1: handle
+                # multiple paths) is decided once for all attributes
+                bases = list(path_keys[target_alias])
+                if len(bases) == 1:
+                    base_key = bases[0]
+                    for attr in attributes:
+                        projected_paths.append(ParticipantPath(start_type, base_key + (EntityResolution(attr),)))
+                elif bases:
+                    for attr in attributes:
+                        attr_res = EntityResolution(attr)
+                        projected_paths.append(PathUnion([ParticipantPath(start_type, base_key + (attr_res,)) for base_key in bases]))
     
     return alias_map, projected_paths
 
 
-def path2query(alias_map: Dict[str, List[ParticipantPath]], projected_paths: List[ProjectedPath], model: List[UddlTuple] = None) -> List[QueryStatement]:
+def path2query(alias_map: Dict[str, List[ParticipantPath]], projected_paths: Sequence[ProjectedPath], model: Optional[List[UddlTuple]] = None) -> List[QueryStatement]:
     """
     Reconstructs QueryStatements from a mapping of aliases and terminal characteristic paths.
     
@@ -241,79 +306,143 @@ def path2query(alias_map: Dict[str, List[ParticipantPath]], projected_paths: Lis
         model: Optional model for type resolution
     """
     if not alias_map: return []
+    model = index_model(model)
 
     root_alias = next(k for k, v in alias_map.items() if any(len(p.resolutions) == 0 for p in v))
     start_type = alias_map[root_alias][0].start_type
+
+    # Resolution key of every path; prefixes are slices of it
+    path_keys = {alias: [p.resolutions for p in paths] for alias, paths in alias_map.items()}
+    # Resolutions of every path -> the first alias (in alias_map order) reached by it
+    path_to_alias: Dict[Tuple[Resolution, ...], str] = {}
+    # The same prefixes as nodes of a trie, numbered from the empty prefix (0):
+    # (node, resolution) -> child node, and node -> first alias reached by it.
+    # Walking a path through the trie visits each of its prefixes with one
+    # resolution hash per step, instead of hashing every prefix tuple
+    prefix_child: Dict[Tuple[int, Resolution], int] = {}
+    node_alias: List[Optional[str]] = [None]
+    for alias, keys in path_keys.items():
+        for key in keys:
+            path_to_alias.setdefault(key, alias)
+            node = 0
+            for res in key:
+                next_node = prefix_child.get((node, res))
+                if next_node is None:
+                    next_node = prefix_child[(node, res)] = len(node_alias)
+                    node_alias.append(None)
+                node = next_node
+            if node_alias[node] is None:
+                node_alias[node] = alias
     
     # Build dependency graph: alias -> set of aliases it depends on
     # An alias depends on another alias if ANY of its paths go through that alias.
     # Since join conditions include all paths, if any path references another alias,
     # that alias must be joined first.
+    # The intermediate aliases of each path are computed once and reused by the
+    # cycle fallback below.
+    path_deps: Dict[str, List[Set[str]]] = {}
     dependencies = {}
     for alias in alias_map:
         if alias == root_alias:
             continue
-        deps = set()
-        for p in alias_map[alias]:
+        alias_path_deps = []
+        for key in path_keys[alias]:
             # Trace through the path and find all intermediate aliases
-            for i in range(len(p.resolutions)):
-                prefix = p.resolutions[:i]
-                intermediate_alias = next((k for k, v in alias_map.items() if any(list(p2.resolutions) == list(prefix) for p2 in v)), None)
+            deps = set()
+            node = 0
+            for res in key:
+                intermediate_alias = node_alias[node]
                 if intermediate_alias and intermediate_alias != alias and intermediate_alias != root_alias:
                     deps.add(intermediate_alias)
-        dependencies[alias] = deps
-    
-    # Topological sort: process aliases after their dependencies
+                node = prefix_child[(node, res)]
+            alias_path_deps.append(deps)
+        path_deps[alias] = alias_path_deps
+        dependencies[alias] = set().union(*alias_path_deps)
+    # Minimum path depth of each alias, computed once for every sort below
+    min_depth: Dict[str, int] = {alias: min(map(len, keys)) for alias, keys in path_keys.items()}
+
+    # Topological sort (Kahn's algorithm): process aliases after their dependencies,
+    # one frontier of ready aliases at a time, each frontier ordered by minimum
+    # depth and then alias_map order so the join order is deterministic.
     # When there are cycles, prefer aliases that have at least one path
     # that doesn't require unprocessed aliases
-    sorted_aliases = []
+    dependents: Dict[str, List[str]] = defaultdict(list)
+    indegree: Dict[str, int] = {}
+    for alias, deps in dependencies.items():
+        indegree[alias] = len(deps)
+        for dep in deps:
+            dependents[dep].append(alias)
+
+    sorted_aliases: List[str] = []
     remaining = set(alias_map.keys()) - {root_alias}
     processed = {root_alias}
-    
+
     def has_joinable_path(alias):
         """Check if alias has at least one path that can be joined with currently processed aliases"""
-        for p in alias_map[alias]:
-            path_deps = set()
-            for i in range(len(p.resolutions)):
-                prefix = p.resolutions[:i]
-                intermediate_alias = next((k for k, v in alias_map.items() if any(list(p2.resolutions) == list(prefix) for p2 in v)), None)
-                if intermediate_alias and intermediate_alias != alias and intermediate_alias != root_alias:
-                    path_deps.add(intermediate_alias)
-            if path_deps.issubset(processed):
-                return True
-        return False
-    
+        return any(deps.issubset(processed) for deps in path_deps[alias])
+
+    map_position = {alias: i for i, alias in enumerate(alias_map)}
+    # Sort key of each alias within a frontier, built once rather than per sort
+    depth_order: Dict[str, Tuple[int, int]] = {alias: (min_depth[alias], i) for alias, i in map_position.items()}
+
+    # Number of aliases that transitively depend on each alias, only needed
+    # (and computed) when breaking cycles
+    subtree_size = {}
+
+    def get_subtree_size(alias):
+        if alias not in subtree_size:
+            reached = set()
+            stack = [alias]
+            while stack:
+                for child in dependents[stack.pop()]:
+                    if child not in reached and child != alias:
+                        reached.add(child)
+                        stack.append(child)
+            subtree_size[alias] = len(reached)
+        return subtree_size[alias]
+
+    def cycle_order(alias):
+        # Among equally deep aliases, join the one with the largest subtree last
+        return (min_depth[alias], get_subtree_size(alias), map_position[alias])
+
+    ready = [a for a in remaining if indegree[a] == 0]
     while remaining:
-        # Find aliases with all dependencies already processed
-        ready = [a for a in remaining if dependencies.get(a, set()).issubset(processed)]
         if not ready:
             # Fallback for cycles: find aliases with joinable paths
             # Prefer those with no unprocessed dependencies that also have joinable paths
             # (to break cycles while still respecting dependency order)
-            candidates = [a for a in remaining if has_joinable_path(a)]
+            candidates = {a for a in remaining if has_joinable_path(a)}
             if candidates:
                 # Among candidates, prefer those whose unprocessed dependencies
                 # are NOT also candidates (process dependencies before dependents)
                 def dependency_score(alias):
-                    unprocessed_deps = dependencies.get(alias, set()) - processed
+                    unprocessed_deps = dependencies[alias] - processed
                     # Penalize if unprocessed deps are also candidates (would create wrong order)
-                    penalty = sum(1 for dep in unprocessed_deps if dep in candidates)
-                    return (penalty, len(unprocessed_deps), min(len(p.resolutions) for p in alias_map[alias]))
-                
-                ready = sorted(candidates, key=dependency_score)
+                    penalty = len(unprocessed_deps & candidates)
+                    return (penalty, len(unprocessed_deps), min_depth[alias])
+
                 # Only take the best one(s) to ensure we process dependencies first
-                if ready:
-                    best_score = dependency_score(ready[0])
-                    ready = [a for a in ready if dependency_score(a) == best_score]
+                scores = {a: dependency_score(a) for a in candidates}
+                best_score = min(scores.values())
+                ready = [a for a, score in scores.items() if score == best_score]
             if not ready:
                 # Last resort: use minimum depth
-                ready = sorted(remaining, key=lambda k: min(len(p.resolutions) for p in alias_map[k]))
-        # Sort ready aliases by minimum depth for deterministic ordering
-        ready.sort(key=lambda k: min(len(p.resolutions) for p in alias_map[k]))
+                ready = list(remaining)
+            ready.sort(key=cycle_order)
+        else:
+            ready.sort(key=depth_order.__getitem__)
         sorted_aliases.extend(ready)
         processed.update(ready)
-        remaining -= set(ready)
-    
+        remaining.difference_update(ready)
+        # Release the dependents whose last unprocessed dependency was just joined
+        next_ready = []
+        for alias in ready:
+            for child in dependents[alias]:
+                indegree[child] -= 1
+                if indegree[child] == 0 and child in remaining:
+                    next_ready.append(child)
+        ready = next_ready
+
     joins = []
     alias_type_tracker = {root_alias: start_type}
     
@@ -328,11 +457,10 @@ def path2query(alias_map: Dict[str, List[ParticipantPath]], projected_paths: Lis
         best_path = None
         source_alias = None
         
-        for p in alias_map[alias]:
-            prefix = p.resolutions[:-1]
+        for p, key in zip(alias_map[alias], path_keys[alias]):
             # Find which alias corresponds to this prefix
             # Note: This lookup assumes unique mapping from path -> alias, which is true by construction
-            p_source_alias = next((k for k, v in alias_map.items() if any(list(p2.resolutions) == list(prefix) for p2 in v)), None)
+            p_source_alias = path_to_alias.get(key[:-1])
             
             if p_source_alias and p_source_alias in alias_type_tracker:
                 best_path = p
@@ -342,8 +470,7 @@ def path2query(alias_map: Dict[str, List[ParticipantPath]], projected_paths: Lis
         # Fallback if logic fails (shouldn't happen in valid DAG)
         if not best_path:
             best_path = alias_map[alias][0]
-            prefix = best_path.resolutions[:-1]
-            source_alias = next((k for k, v in alias_map.items() if any(list(p2.resolutions) == list(prefix) for p2 in v)), None)
+            source_alias = path_to_alias.get(path_keys[alias][0][:-1])
 
         source_type = alias_type_tracker.get(source_alias) if source_alias else None
         
@@ -353,18 +480,25 @@ def path2query(alias_map: Dict[str, List[ParticipantPath]], projected_paths: Lis
         alias_type_tracker[alias] = target_type
         
         equivalences = []
-        for p in alias_map[alias]:
-            prefix = p.resolutions[:-1]
-            try:
-                # Find source alias for THIS specific path (diamond joins might have different parents)
-                path_source_alias = next(k for k, v in alias_map.items() if any(list(p2.resolutions) == list(prefix) for p2 in v))
-                res = p.resolutions[-1]
-                if isinstance(res, EntityResolution):
-                    equivalences.append(Equivalence(Reference(path_source_alias, res.rolename), Reference(alias, None)))
-                else:
-                    equivalences.append(Equivalence(Reference(alias, res.rolename), Reference(path_source_alias, None)))
-            except StopIteration: continue
-        joins.append(Join(Entity(target_type, alias), equivalences))
+        # Paths through the same parent alias and rolename (e.g. both sides of a
+        # diamond extended by one more step) would repeat the same ON condition
+        seen_conditions = set()
+        for key in path_keys[alias]:
+            # Find source alias for THIS specific path (diamond joins might have different parents)
+            path_source_alias = path_to_alias.get(key[:-1])
+            if path_source_alias is None:
+                continue
+            res = key[-1]
+            is_entity = isinstance(res, EntityResolution)
+            condition = (path_source_alias, res.rolename, is_entity)
+            if condition in seen_conditions:
+                continue
+            seen_conditions.add(condition)
+            if is_entity:
+                equivalences.append(Equivalence(Reference(path_source_alias, res.rolename), Reference(alias, None)))
+            else:
+                equivalences.append(Equivalence(Reference(alias, res.rolename), Reference(path_source_alias, None)))
+        joins.append(Join(Entity(target_type, alias), tuple(equivalences)))
 
     # Reconstruct projections (Ensuring only characteristics are selected)
     # For PathUnion, we use all paths in the union (they represent alternative ways to reach the same data)
@@ -372,18 +506,22 @@ def path2query(alias_map: Dict[str, List[ParticipantPath]], projected_paths: Lis
     for proj_path in projected_paths:
         # Handle both single paths and unions
         paths_to_process = proj_path.paths if isinstance(proj_path, PathUnion) else [proj_path]
+        # The paths of a union usually end at the same alias (e.g. both sides of a
+        # diamond join), which is still a single column of the query
+        seen_references = set()
         
         for p in paths_to_process:
-            prefix = p.resolutions[:-1]
-            try:
-                source_alias = next(k for k, v in alias_map.items() if any(list(p2.resolutions) == list(prefix) for p2 in v))
-                projections.append(ProjectedCharacteristic(Reference(source_alias, p.resolutions[-1].rolename)))
-            except StopIteration: continue
+            source_alias = path_to_alias.get(p.resolutions[:-1])
+            if source_alias is not None:
+                reference = Reference(source_alias, p.resolutions[-1].rolename)
+                if reference not in seen_references:
+                    seen_references.add(reference)
+                    projections.append(ProjectedCharacteristic(reference))
 
-    return [QueryStatement(projections, FromClause([Entity(start_type, root_alias)], joins))]
+    return [QueryStatement(tuple(projections), FromClause((Entity(start_type, root_alias),), tuple(joins)))]
 
 
-def _get_alias_type(path: ParticipantPath, model: List[UddlTuple] = None) -> str:
+def _get_alias_type(path: ParticipantPath, model: Optional[List[UddlTuple]] = None) -> str:
     """Helper to determine the entity type of a path's terminal node."""
     if not path.resolutions:
         return path.start_type
@@ -402,6 +540,7 @@ def _get_alias_type(path: ParticipantPath, model: List[UddlTuple] = None) -> str
         return path.start_type
     
     # Get the parent type by resolving up to the second-to-last resolution
+    model = index_model(model)
     if len(path.resolutions) == 1:
         source_type = path.start_type
     else:
@@ -411,40 +550,40 @@ def _get_alias_type(path: ParticipantPath, model: List[UddlTuple] = None) -> str
     
     # Look up the rolename in the model
     if model:
-        for t in model:
-            if t.subject == source_type and t.rolename == last.rolename:
-                obj = str(t.object)
-                return obj.split('.')[0] if '.' in obj else obj
+        obj = model.target(source_type, last.rolename)
+        if obj is not None:
+            return obj.split('.')[0]
     
     # Fallback to rolename
     return last.rolename
 
 
-def _resolve_target_type(paths: List[ParticipantPath], model: List[UddlTuple], source_type: str = None) -> str:
+def _resolve_target_type(paths: List[ParticipantPath], model: Optional[List[UddlTuple]], source_type: Optional[str] = None) -> str:
     """Uses model lookups to find the object type of a rolename."""
     last_res = paths[0].resolutions[-1]
-    if isinstance(last_res, AssociationResolution):
+    # Paths built by query2path already carry their target type
+    if isinstance(last_res, EntityResolution):
+        if last_res.target_type:
+            return last_res.target_type
+    elif isinstance(last_res, AssociationResolution):
         return last_res.association_name
-    
-    if isinstance(last_res, EntityResolution) and last_res.target_type:
-        return last_res.target_type
 
+    model = index_model(model)
     if not model:
         return last_res.rolename
 
     if source_type:
-        for t in model:
-            if t.subject == source_type and t.rolename == last_res.rolename:
-                obj = str(t.object)
-                return obj.split('.')[0] if '.' in obj else obj
-            
+        obj = model.target(source_type, last_res.rolename)
+        if obj is not None:
+            return obj.split('.')[0]
+
     return last_res.rolename
 
 
 def _reconstruct_alias_map(
-    model: List[UddlTuple], 
+    model: Optional[List[UddlTuple]], 
     paths: List[ParticipantPath], 
-    partial_map: Dict[str, List[ParticipantPath]] = None
+    partial_map: Optional[Dict[str, List[ParticipantPath]]] = None
 ) -> Dict[str, List[ParticipantPath]]:
     """
     Generates a full alias map from terminal paths and a partial map (for AND joins).
@@ -456,80 +595,59 @@ def _reconstruct_alias_map(
     
     # Track path strings to existing aliases to prevent duplicate nodes
     path_to_alias: Dict[str, str] = {str(p): k for k, v in partial_map.items() for p in v}
-    
+
+    model = index_model(model)
+
     def get_entity_type(source_type: str, rolename: str) -> str:
         """Looks up the target type in the model tuples."""
         if not model:
             return rolename
-        for t in model:
-            if t.subject == source_type and t.rolename == rolename:
-                # Return the type name (stripping namespaces if present)
-                obj = str(t.object)
-                return obj.split('.')[-1]
-        return rolename
-
-    def get_or_create_alias(path_obj: ParticipantPath) -> str:
-        path_str = str(path_obj)
-        if path_str in path_to_alias:
-            return path_to_alias[path_str]
-        
-        # Determine the Type name for the alias
-        if not path_obj.resolutions:
-            type_name = path_obj.start_type
-        else:
-            # We need to find the type of the parent to look up the current rolename
-            parent_path = ParticipantPath(path_obj.start_type, path_obj.resolutions[:-1])
-            parent_alias = get_or_create_alias(parent_path)
-            
-            # Simplified tracker: find the type of the parent_alias
-            # In this recursive call, we'll know the parent type because we processed root-out
-            parent_type = path_obj.start_type
-            if parent_path.resolutions:
-                # Trace types from root
-                curr_type = path_obj.start_type
-                for res in parent_path.resolutions:
-                    if isinstance(res, AssociationResolution):
-                        curr_type = res.association_name
-                    else:
-                        curr_type = get_entity_type(curr_type, res.rolename)
-                parent_type = curr_type
-            
-            last_res = path_obj.resolutions[-1]
-            if isinstance(last_res, AssociationResolution):
-                type_name = last_res.association_name
-            else:
-                type_name = get_entity_type(parent_type, last_res.rolename)
-        
-        # Ensure unique alias name (e.g., if there are multiple 'B' types)
-        alias_name = type_name
-        counter = 1
-        while alias_name in alias_map:
-            alias_name = f"{type_name}_{counter}"
-            counter += 1
-            
-        alias_map[alias_name] = [path_obj]
-        path_to_alias[path_str] = alias_name
-        return alias_name
+        obj = model.target(source_type, rolename)
+        if obj is None:
+            return rolename
+        # Return the type name (stripping namespaces if present)
+        return obj.split('.')[-1]
 
     # Process all paths. Note: terminal paths end in a characteristic, 
     # so we only build aliases for the prefix (the entities).
     for p in paths:
-        entity_path = ParticipantPath(p.start_type, p.resolutions[:-1])
-        # Ensure the whole chain from root to entity is aliased
-        for i in range(len(entity_path.resolutions) + 1):
-            sub_path = ParticipantPath(p.start_type, entity_path.resolutions[:i])
-            get_or_create_alias(sub_path)
+        # Ensure the whole chain from root to entity is aliased. Each prefix's
+        # string and type are carried forward from its parent, so the chain is
+        # walked once, and a path object is only built for new prefixes
+        entity_resolutions = p.resolutions[:-1]
+        prefix_str = prefix_type = p.start_type
+        for i in range(len(entity_resolutions) + 1):
+            if i:
+                res = entity_resolutions[i - 1]
+                prefix_str += str(res)
+                if isinstance(res, AssociationResolution):
+                    prefix_type = res.association_name
+                else:
+                    prefix_type = get_entity_type(prefix_type, res.rolename)
+            if prefix_str in path_to_alias:
+                continue
+
+            # Ensure unique alias name (e.g., if there are multiple 'B' types)
+            alias_name = prefix_type
+            counter = 1
+            while alias_name in alias_map:
+                alias_name = f"{prefix_type}_{counter}"
+                counter += 1
+
+            alias_map[alias_name] = [ParticipantPath(p.start_type, entity_resolutions[:i])]
+            path_to_alias[prefix_str] = alias_name
 
     return alias_map
 
 
-def load_model(model_path: str) -> List[UddlTuple]:
-    """Loads a model from a file."""
+def load_model(model_path: Union[str, pathlib.Path]) -> ModelIndex:
+    """Loads a model from a file, indexed for the lookups done during conversion."""
     p = pathlib.Path(model_path)
     if p.suffix.lower() in ['.face', '.xml']:
-        return [t for t in uddl2tuple(ET.parse(p)) if isinstance(t, UddlTuple)]
+        tuples = uddl2tuple(ET.parse(p))
     else:
-        return [t for t in parse_tuple(p) if isinstance(t, UddlTuple)]
+        tuples = parse_tuple(p)
+    return ModelIndex(t for t in tuples if isinstance(t, UddlTuple))
 
 
 if __name__ == "__main__":
@@ -592,11 +710,11 @@ if __name__ == "__main__":
                 print(q.pretty_print())
     else:
         # Example: Diamond Join
-        q = "SELECT d FROM A JOIN B ON A.b JOIN C ON A.c JOIN D ON D.b_ref = B AND D.c_ref = C"
+        demo_query = "SELECT d FROM A JOIN B ON A.b JOIN C ON A.c JOIN D ON D.b_ref = B AND D.c_ref = C"
         print("Demo Query:")
-        print(q)
+        print(demo_query)
         print()
-        alias_map, projected_paths = query2path(query_ast=get_ast(q))
+        alias_map, projected_paths = query2path(query_ast=get_ast(demo_query))
         print("\nAlias Map:")
         for alias, paths in alias_map.items():
             print(f"  {alias}: {[str(p) for p in paths]}")
@@ -1,7 +1,7 @@
 import argparse
 from typing import List, Dict
 
-from query_path_conversion import query2path, load_model, PathUnion, ProjectedPath, _get_alias_type
+from query_path_conversion import query2path, load_model, PathUnion, ProjectedPath, _get_alias_type, index_model
 from query_parser import get_ast
 from participant_path_parser import ParticipantPath, EntityResolution, AssociationResolution
 from tuple2owl import NS_DEFAULT
@@ -34,12 +34,13 @@ def _resolve_participant_path_to_type(path: ParticipantPath, model: List[UddlTup
     
     # Look up the rolename in the model
     if model:
-        for t in model:
-            if t.subject == source_type and t.rolename == last.rolename:
-                if isinstance(t.object, str):
-                    return t.object.split('.')[0] if '.' in t.object else t.object
-                elif isinstance(t.object, ParticipantPath):
-                    return _resolve_participant_path_to_type(t.object, model)
+        model = index_model(model)
+        t = model.tuples.get((source_type, last.rolename))
+        if t is not None:
+            if isinstance(t.object, str):
+                return t.object.split('.')[0] if '.' in t.object else t.object
+            elif isinstance(t.object, ParticipantPath):
+                return _resolve_participant_path_to_type(t.object, model)
     
     # Fallback to rolename
     return last.rolename
@@ -64,15 +65,14 @@ def _generate_property_name_for_path_step(current_type: str, resolution, model:
         # Find target type by looking up in model
         target_type = None
         if model:
-            for t in model:
-                if t.subject == current_type and t.rolename == resolution.rolename:
-                    if isinstance(t.object, str):
-                        target_type = t.object.split('.')[0] if '.' in t.object else t.object
-                        break
-                    elif isinstance(t.object, ParticipantPath):
-                        # Resolve the path to get the final type
-                        target_type = _resolve_participant_path_to_type(t.object, model)
-                        break
+            model = index_model(model)
+            t = model.tuples.get((current_type, resolution.rolename))
+            if t is not None:
+                if isinstance(t.object, str):
+                    target_type = t.object.split('.')[0] if '.' in t.object else t.object
+                elif isinstance(t.object, ParticipantPath):
+                    # Resolve the path to get the final type
+                    target_type = _resolve_participant_path_to_type(t.object, model)
         
         if not target_type:
             # If model is provided but lookup failed, do not generate property (matches tuple2owl)
@@ -108,10 +108,9 @@ def _get_observable_type_from_path(path: ParticipantPath, model: List[UddlTuple]
     
     # Look up the observable type
     if model:
-        for t in model:
-            if t.subject == source_type and t.predicate == 'composes' and t.rolename == characteristic_name:
-                if isinstance(t.object, str):
-                    return t.object.split('.')[-1] if '.' in t.object else t.object
+        observable = index_model(model).compositions.get((source_type, characteristic_name))
+        if observable is not None:
+            return observable.split('.')[-1] if '.' in observable else observable
     
     # Fallback: assume the characteristic name is the observable type
     return characteristic_name
@@ -126,68 +125,15 @@ def generate_sparql(alias_map: Dict[str, List[ParticipantPath]],
     Handles both ParticipantPath and PathUnion in projections to support 
     ambiguous references and multi-path navigation.
     """
+    model = index_model(model)
     where_clauses = []
     select_vars = set()
     
-    # Track which triples we've already added to avoid duplicates in the graph
-    seen_triples = set()
-
-    # 1. Resolve Types for all Aliases
-    # We use the _get_alias_type helper from query_path_conversion
-    alias_to_type = {}
-    for alias, paths in alias_map.items():
-        # Any path in the list for this alias will resolve to the same type
-        # We use the first path as representative
-        if paths:
-            alias_to_type[alias] = _get_alias_type(paths[0], model)
-        else:
-            alias_to_type[alias] = "Unknown"
-
-    # 2. (Skipped) Inject rdf:type triples for all aliases
-    # We are selecting Observation individuals that represent paths, not querying a populated graph of instances.
-    # So we don't need to match ?alias a :Type.
-    # # 2. Inject rdf:type triples for all aliases
-    # # This ensures ?alias is linked to :ActualTypeName (e.g., ?t1 a :TemperatureSensor)
-    # for alias, type_name in alias_to_type.items():
-    #     type_triple = f"  ?{alias} a :{type_name} ."
-    #     where_clauses.append(type_triple)
-
-    # 3. (Skipped) Process the Alias Map to build the graph structure (JOINs)
-    # The graph structure is implicitly handled by the property chains of the Observation individuals.
-    # We don't need to generate structural triples like ?source :rel ?target.
-    # # 3. Process the Alias Map to build the graph structure (JOINs)
-    # # We sort by path length to ensure the root triples appear first
-    # sorted_aliases = sorted(alias_map.keys(), key=lambda k: min(len(p.resolutions) for p in alias_map[k]))
-    
-    # for alias in sorted_aliases:
-    #     paths = alias_map[alias]
-    #     for p in paths:
-    #         if not p.resolutions:
-    #             continue  # Skip root entity itself
-            
-    #         # Find the parent alias for this specific path segment
-    #         prefix_res = p.resolutions[:-1]
-    #         try:
-    #             source_alias = next(k for k, v in alias_map.items() 
-    #                               if any(list(p2.resolutions) == list(prefix_res) for p2 in v))
-    #         except StopIteration:
-    #             continue
-
-    #         leaf_res = p.resolutions[-1]
-    #         predicate = f":{leaf_res.rolename}"
-            
-    #         if isinstance(leaf_res, EntityResolution):
-    #             # Forward navigation: Subject -> Predicate -> Object
-    #             triple = f"  ?{source_alias} {predicate} ?{alias} ."
-    #         else:
-    #             # Backward navigation: Object -> Predicate -> Subject
-    #             triple = f"  ?{alias} {predicate} ?{source_alias} ."
-            
-    #         if triple not in seen_triples:
-    #             where_clauses.append(triple)
-    #             seen_triples.add(triple)
+    # Aliases are not matched as instances, so there are no rdf:type or structural
+    # (JOIN) triples: the query selects Observation individuals, whose property
+    # chains already encode the paths of the alias map.
 
-    # 4. Process Projected Paths (SELECT clause) - Select Observation individuals
+    # Process Projected Paths (SELECT clause) - Select Observation individuals
     for i, proj in enumerate(projected_paths):
         if isinstance(proj, ParticipantPath):
             # Standard single-path projection
@@ -251,8 +197,12 @@ def generate_sparql(alias_map: Dict[str, List[ParticipantPath]],
             where_clauses.append(f"  ?{obs_var_name} a :Observation .")
             where_clauses.append(f"  ?{obs_var_name} :hasObservable :{observable_type} .")
             
-            # Create UNION branches for each possible path
+            # Create UNION branches for each possible path, kept as clause lists and
+            # formatted only once it is known whether a UNION is needed. Paths whose
+            # property chains coincide (e.g. when a step cannot be resolved) give the
+            # same branch, which is only added once
             union_branches = []
+            seen_branches = set()
             for path_idx, p in enumerate(proj.paths):
                 if not p.resolutions:
                     continue
@@ -262,7 +212,7 @@ def generate_sparql(alias_map: Dict[str, List[ParticipantPath]],
                 
                 # Start type property (points to type class)
                 start_type_prop = f"has{p.start_type}"
-                branch_clauses.append(f"    ?{obs_var_name} :{start_type_prop} :{p.start_type} .")
+                branch_clauses.append(f"?{obs_var_name} :{start_type_prop} :{p.start_type} .")
                 
                 # Follow the path
                 # Skip the last resolution (the characteristic) - it's represented by hasObservable
@@ -273,27 +223,27 @@ def generate_sparql(alias_map: Dict[str, List[ParticipantPath]],
                         break
                     
                     # Properties point to type classes, not instances
-                    branch_clauses.append(f"    ?{obs_var_name} :{prop_name} :{target_type} .")
+                    branch_clauses.append(f"?{obs_var_name} :{prop_name} :{target_type} .")
                     
                     current_type = target_type
                 
-                if branch_clauses:
-                    branch = "{\n" + "\n".join(branch_clauses) + "\n  }"
-                    union_branches.append(branch)
+                branch_key = tuple(branch_clauses)
+                if branch_key not in seen_branches:
+                    seen_branches.add(branch_key)
+                    union_branches.append(branch_clauses)
             
             if len(union_branches) == 1:
                 # Single branch, no UNION needed
-                # Extract the clauses from the branch (remove outer braces)
-                branch_content = union_branches[0][2:-2]  # Remove "{\n" and "\n  }"
-                for clause in branch_content.strip().split('\n'):
-                    if clause.strip():
-                        where_clauses.append(clause.strip())
+                where_clauses.extend(union_branches[0])
             elif len(union_branches) > 1:
                 # Multiple branches, use UNION
-                union_pattern = "  " + " UNION\n  ".join(union_branches)
+                union_pattern = "  " + " UNION\n  ".join(
+                    "{\n" + "\n".join(f"    {clause}" for clause in branch) + "\n  }"
+                    for branch in union_branches
+                )
                 where_clauses.append(union_pattern)
 
-    # 5. Assemble Query
+    # Assemble Query
     sparql = f"PREFIX : <{namespace}>\n\n"
     sparql += f"SELECT {' '.join(sorted(list(select_vars)))}\n"
     sparql += "WHERE {\n"
@@ -0,0 +1,27 @@
+import pytest
+
+from query_parser import UDDLQueryParser
+
+
+def parse(query):
+    return UDDLQueryParser(query).parse()
+
+
+def test_parse_join_query():
+    ast = parse("SELECT ALL a.x AS ax, y FROM A AS a JOIN B b ON a.b = b AND a")
+    assert str(ast) == "SELECT ALL a.x AS ax, y FROM A AS a JOIN B AS b ON a.b = b AND a"
+
+
+@pytest.mark.parametrize("query, message", [
+    ("SELECT a", "Expected FROM, got None"),
+    ("a FROM A", "Expected SELECT, got ID"),
+    ("SELECT a FROM A JOIN", "Expected ID, got None"),
+    ("SELECT a FROM A JOIN B", "Expected ON, got None"),
+    ("SELECT a FROM A JOIN B a.b = B", "Expected ON, got PERIOD"),
+    ("SELECT a FROM A JOIN B ON", "Expected ID, got None"),
+    ("SELECT a FROM A JOIN B ON a. = B", "Expected ID, got EQUALS"),
+    ("SELECT a FROM A JOIN B ON a.b =", "Expected ID, got None"),
+])
+def test_malformed_query_errors(query, message):
+    with pytest.raises(SyntaxError, match=f"^{message}$"):
+        parse(query)
@@ -0,0 +1,46 @@
+import pytest
+
+from query_path_conversion import query2path, path2query, get_ast
+
+
+def test_unary_identity_join_adds_no_path():
+    # JOIN B ON A names no rolename, so B cannot be reached from A
+    alias_map, projected_paths = query2path(get_ast("SELECT B.x FROM A JOIN B ON A"))
+    assert alias_map["B"] == []
+    assert projected_paths == []
+
+    alias_map, projected_paths = query2path(get_ast("SELECT B.x FROM A JOIN B ON A.b"))
+    assert [str(p) for p in alias_map["B"]] == ["A.b"]
+    assert [str(p) for p in projected_paths] == ["A.b.x"]
+
+
+# D is reached through both B and C, and E is one step beyond that diamond
+DIAMOND_QUERY = (
+    "SELECT E.y FROM A JOIN B ON A.b = B JOIN C ON A.c = C "
+    "JOIN D ON B.d = D AND C.d = D JOIN E ON D.e = E"
+)
+
+
+@pytest.fixture(scope="module")
+def diamond_paths():
+    return query2path(get_ast(DIAMOND_QUERY))
+
+
+def test_extended_diamond_join_emits_one_condition(diamond_paths):
+    alias_map, projected_paths = diamond_paths
+    # E has a path through each side of the diamond, both ending in D.e
+    assert [str(p) for p in alias_map["E"]] == ["A.b.d.e", "A.c.d.e"]
+
+    query = path2query(alias_map, projected_paths)[0]
+    join_e = query.from_clause.joins[-1]
+    assert str(join_e.target) == "E"
+    assert [str(c) for c in join_e.on] == ["D.e = E"]
+
+
+def test_path_union_with_one_reference_projects_one_column(diamond_paths):
+    alias_map, projected_paths = diamond_paths
+    # Both arms of the union end at the same alias, E
+    assert [str(p) for p in projected_paths] == ["{A.b.d.e.y | A.c.d.e.y}"]
+
+    query = path2query(alias_map, projected_paths)[0]
+    assert [str(p) for p in query.projections] == ["E.y"]
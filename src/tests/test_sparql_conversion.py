@@ -0,0 +1,37 @@
+import pytest
+
+from query_path_conversion import query2path, get_ast
+from sparql_conversion import generate_sparql
+from tuple import UddlTuple
+
+
+# D is reached through both B and C, so D.z is projected as a PathUnion
+DIAMOND_QUERY = (
+    "SELECT D.z FROM A JOIN B ON A.b = B JOIN C ON A.c = C "
+    "JOIN D ON B.d = D AND C.d = D"
+)
+
+
+@pytest.fixture(scope="module")
+def unknown_rolename_model():
+    # The model knows A but none of its rolenames
+    return [UddlTuple("A", "composes", "Foo", "other")]
+
+
+def test_identical_union_arms_collapse_to_one_branch(unknown_rolename_model):
+    # Both arms stop after the start type, so they match the same triples
+    alias_map, projected_paths = query2path(get_ast(DIAMOND_QUERY), unknown_rolename_model)
+    assert [str(p) for p in projected_paths] == ["{A.b.d.z | A.c.d.z}"]
+
+    sparql = generate_sparql(alias_map, projected_paths, unknown_rolename_model)
+    assert "UNION" not in sparql
+    assert sparql.count(":hasA :A .") == 1
+
+
+def test_distinct_union_arms_are_kept():
+    alias_map, projected_paths = query2path(get_ast(DIAMOND_QUERY))
+
+    sparql = generate_sparql(alias_map, projected_paths)
+    assert sparql.count("UNION") == 1
+    assert ":hasAComposition_b :b ." in sparql
+    assert ":hasAComposition_c :c ." in sparql
@@ -0,0 +1,48 @@
+import contextlib
+import io
+import pathlib
+
+import pytest
+
+import generate_summary_stat_table
+from generate_summary_stat_table import generate_summary_stats
+
+
+INCOSE_FACE_FILE = pathlib.Path(__file__).parent.parent / "examples/incose_uddl2owl.face"
+
+
+@pytest.fixture(scope="module")
+def incose_summary():
+    # Returns the stats and the printed table
+    table = io.StringIO()
+    with contextlib.redirect_stdout(table):
+        stats = generate_summary_stats(INCOSE_FACE_FILE)
+    return stats, table.getvalue()
+
+
+def test_incose_summary_stats(incose_summary):
+    stats, table = incose_summary
+
+    # The model's entity count, which a query's entity count used to overwrite
+    assert stats['num_entities'] == 12
+    assert stats['num_associations'] == 16
+    assert stats['total_queries'] == 4
+
+    # Largest counts over the model's queries
+    assert stats['max_projections_in_query'] == 7
+    assert stats['max_entities_in_query'] == 1
+    assert stats['max_joins_in_query'] == 12
+    assert stats['max_join_conditions_in_query'] == 12
+
+    # The printed table shows the same values
+    assert "Number of Entities: & 12" in table
+    assert "Max Projections: & 7" in table
+    assert "Max Join Conditions: & 12" in table
+
+
+def test_pooled_parsing_matches_serial(incose_summary, monkeypatch):
+    serial_stats, _ = incose_summary
+
+    # The example model is below the threshold, so force the worker pool
+    monkeypatch.setattr(generate_summary_stat_table, "_MIN_QUERIES_FOR_POOL", 0)
+    assert generate_summary_stats(INCOSE_FACE_FILE) == serial_stats
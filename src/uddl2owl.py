@@ -8,7 +8,7 @@ from parse_tuple import parse_tuple
 from tuple import UddlTuple
 from add_individuals import add_individuals
 from query_parser import QueryStatement
-from query_path_conversion import query2path
+from query_path_conversion import query2path, index_model
 from sparql_conversion import generate_sparql
 
 
@@ -48,8 +48,9 @@ def uddl2owl(uddl_file: pathlib.Path, output_file: pathlib.Path = None, generate
 
     # Output SPARQL queries if requested
     if output_sparql:
-        # Separate data tuples from queries for model
-        data_tuples = [t for t in tuples if isinstance(t, UddlTuple)]
+        # Separate data tuples from queries for model, indexed once for all
+        # of the conversions below rather than once per query and per call
+        data_tuples = index_model([t for t in tuples if isinstance(t, UddlTuple)])
         # Find all QueryStatement objects
         queries = [t for t in tuples if isinstance(t, QueryStatement)]
         